@@ -98,10 +98,10 @@ from .parser.gedcom_data_management import (
     _remove_event_internal, _add_note_to_entity_internal,
     _create_source_internal, _delete_note_entity_internal, _new_empty_gedcom_internal,
     _update_person_attribute_internal, _update_person_details_internal,
-    batch_update_person_attributes
+    batch_update_person_attributes as _batch_update_person_attributes_internal
 )
 from .parser.gedcom_search import (
-    _dijkstra_bidirectional_search, _get_person_neighbors_lazy, _get_person_neighbors_lazy_reverse,
+    _dijkstra_bidirectional_search, _get_person_neighbors_lazy,
     _generate_relationship_chain_lazy, _correct_relationship_direction, _generate_relationship_description,
     _format_relationship_with_gender, _format_relationship_description,
     find_shortest_relationship_path as compute_shortest_relationship_path, _find_all_relationship_paths_internal, _find_all_paths_to_ancestor_internal
@@ -110,7 +110,7 @@ from .parser.gedcom_utils import (
     normalize_string, _get_gedcom_tag_from_event_type, _get_gedcom_tag_from_attribute_type,
     extract_birth_year, _extract_year_from_genealogy_date, _normalize_genealogy_name,
     _normalize_genealogy_date, _normalize_genealogy_place, _extract_year_from_date,
-    _matches_criteria
+    _compile_criteria, _matches_compiled
 )
 from .parser.gedcom_analysis import (
     _get_attribute_statistics_internal, get_statistics_report, _get_timeline_internal, _get_ancestors_internal, _get_descendants_internal,
@@ -887,10 +887,11 @@ async def query_people_by_criteria(ctx: Context, filters: str = "", page: int =
         # PERFORMANCE OPTIMIZATION: Use lookup dictionary instead of iterating through all elements
         # Get all people
         matching_people = []
+        compiled_criteria = _compile_criteria(filter_criteria)
 
         for individual_elem in gedcom_ctx.individual_lookup.values():
             person = _extract_person_details(individual_elem, gedcom_ctx)
-            if person and _matches_criteria(person, filter_criteria):
+            if person and _matches_compiled(person, compiled_criteria):
                 matching_people.append(person)
 
         # Sort by ID for consistent ordering
@@ -1578,8 +1579,8 @@ async def update_person_attribute(person_id: str, attribute_tag: str, new_value:
     """
     try:
         gedcom_ctx = get_gedcom_context(ctx)
-        result = _update_person_attribute_internal(gedcom_ctx, person_id, attribute_tag, new_value)
-        if "Error" in result:
+        ok, result = _update_person_attribute_internal(gedcom_ctx, person_id, attribute_tag, new_value)
+        if not ok:
             return result
 
         # Clear caches and rebuild lookups after successful update
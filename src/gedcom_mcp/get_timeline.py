@@ -69,7 +69,7 @@ from .parser.gedcom_data_management import (
     batch_update_person_attributes
 )
 from .parser.gedcom_search import (
-    _dijkstra_bidirectional_search, _get_person_neighbors_lazy, _get_person_neighbors_lazy_reverse,
+    _dijkstra_bidirectional_search, _get_person_neighbors_lazy,
     _generate_relationship_chain_lazy, _correct_relationship_direction, _generate_relationship_description,
     _format_relationship_with_gender, _format_relationship_description,
     find_shortest_relationship_path as compute_shortest_relationship_path, _find_all_relationship_paths_internal, _find_all_paths_to_ancestor_internal
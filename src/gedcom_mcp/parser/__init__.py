@@ -84,7 +84,9 @@ from .gedcom_date_utils import (
     GenealogyDate,
     DateCertainty,
     parse_genealogy_date,
+    parse_genealogy_dates_bulk,
     validate_date_consistency,
+    validate_date_consistency_parsed,
     get_date_certainty_level,
 )
 
@@ -92,6 +94,7 @@ from .gedcom_date_utils import (
 from .gedcom_name_utils import (
     GenealogyName,
     parse_genealogy_name,
+    parse_genealogy_names,
     normalize_name,
     find_name_variants,
     format_gedcom_name,
@@ -102,6 +105,7 @@ from .gedcom_name_utils import (
 from .gedcom_place_utils import (
     NormalizedPlace,
     normalize_place_name,
+    normalize_place_names,
     extract_geographic_hierarchy,
 )
 
@@ -152,11 +156,14 @@ __all__ = [
     "GenealogyDate",
     "DateCertainty",
     "parse_genealogy_date",
+    "parse_genealogy_dates_bulk",
     "validate_date_consistency",
+    "validate_date_consistency_parsed",
     "get_date_certainty_level",
     # Name utilities
     "GenealogyName",
     "parse_genealogy_name",
+    "parse_genealogy_names",
     "normalize_name",
     "find_name_variants",
     "format_gedcom_name",
@@ -164,5 +171,6 @@ __all__ = [
     # Place utilities
     "NormalizedPlace",
     "normalize_place_name",
+    "normalize_place_names",
     "extract_geographic_hierarchy",
 ]
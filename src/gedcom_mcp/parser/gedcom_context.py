@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Any, Dict, Optional
+import os
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from cachetools import LRUCache
 
@@ -11,6 +12,7 @@ try:
     from gedcom.element.individual import IndividualElement
     from gedcom.element.family import FamilyElement
     from gedcom.element.object import ObjectElement
+    from gedcom.element.element import Element
 except ImportError:
     print("Error: python-gedcom library not found. Please install it with: pip install python-gedcom")
     raise
@@ -19,13 +21,47 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 # --- Cache Configuration ---
-# Centralized place to configure cache sizes
+def _cache_size(name: str, default: int) -> int:
+    """Read a cache bound from GEDCOM_CACHE_<NAME>, falling back to the default"""
+    env_var = f"GEDCOM_CACHE_{name.upper()}"
+    value = os.getenv(env_var)
+    if not value:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size <= 0:
+        logger.warning(f"Ignoring invalid {env_var}={value!r}; using {default}")
+        return default
+    return size
+
+
+# Centralized place to configure cache sizes; each can be overridden with
+# a GEDCOM_CACHE_<NAME> environment variable (e.g. GEDCOM_CACHE_NEIGHBOR=50000)
 CACHE_SIZES = {
-    "person_details": 5000,
-    "person_relationships": 2000,
-    "neighbor": 10000,
+    name: _cache_size(name, default)
+    for name, default in {
+        "person_details": 5000,
+        "person_relationships": 2000,
+        "neighbor": 10000,
+        "sibling": 10000,
+        "birth_year": 10000,
+        # Whole-tree adjacency maps, one per set of allowed relationships
+        "adjacency": 4,
+        "component": 4,
+        # (path, distance) pairs from _find_shortest_core, cheap enough to keep more of
+        "shortest": 4096,
+        # Results of find_shortest_relationship_path, keyed by its arguments
+        "path": 1024,
+        # IDs remembered by the person_details admission doorkeeper before it resets
+        "person_details_doorkeeper": 20000,
+    }.items()
 }
 
+# Child tags of individuals and families that point at another record
+XREF_TAGS = frozenset({"HUSB", "WIFE", "CHIL", "FAMC", "FAMS", "NOTE", "SOUR"})
+
 @dataclass
 class GedcomContext:
     """Context for managing GEDCOM data and caches"""
@@ -35,20 +71,46 @@ class GedcomContext:
     family_lookup: Dict[str, FamilyElement] = field(default_factory=dict)
     source_lookup: Dict[str, ObjectElement] = field(default_factory=dict)
     note_lookup: Dict[str, ObjectElement] = field(default_factory=dict)
+    # Reverse index of cross-reference child elements: (parent_id, tag, value) -> element
+    xref: Dict[Tuple[str, str, str], Element] = field(default_factory=dict)
     
     # Use LRUCache with configurable sizes
     person_details_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["person_details"]))
     person_relationships_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["person_relationships"]))
     neighbor_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["neighbor"]))
+    sibling_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["sibling"]))
+    birth_year_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["birth_year"]))
+    adjacency_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["adjacency"]))
+    # Person ID -> connected component representative, one map per set of allowed relationships
+    component_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["component"]))
+    shortest_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["shortest"]))
+    path_cache: LRUCache = field(default_factory=lambda: LRUCache(maxsize=CACHE_SIZES["path"]))
+    # IDs seen once; person details are only cached on their second request
+    person_details_seen: set = field(default_factory=set)
 
     max_time: int = 60  # time limit (1 minutes)
     max_nodes: int = 250000  # Much higher limit to find meeting points
 
-    def clear_caches(self):
-        """Clear all internal caches to free memory"""
+    def clear_caches(self, new_tree: bool = False):
+        """Clear all internal caches to free memory
+        
+        Args:
+            new_tree: Set when a different tree is loaded or created, so the
+                person_details admission history is reset as well
+        """
         self.person_relationships_cache.clear()
         self.person_details_cache.clear()
         self.neighbor_cache.clear()
+        self.sibling_cache.clear()
+        self.birth_year_cache.clear()
+        self.adjacency_cache.clear()
+        self.component_cache.clear()
+        self.shortest_cache.clear()
+        self.path_cache.clear()
+        # person_details_seen only records access frequency, so edits to the same tree keep it;
+        # in a different tree the same IDs name different people
+        if new_tree:
+            self.person_details_seen.clear()
         logger.info("All GEDCOM caches cleared.")
 
 
@@ -79,12 +141,40 @@ def get_gedcom_context(ctx):
     return gedcom_ctx
 
 
+def _admit_person_details(gedcom_ctx: GedcomContext, person_id: str, person_details):
+    """Cache person details only for IDs requested before (TinyLFU-style doorkeeper).
+
+    One-shot lookups such as a full tree export then do not evict hot entries.
+    """
+    seen = gedcom_ctx.person_details_seen
+    if person_id in seen:
+        gedcom_ctx.person_details_cache[person_id] = person_details
+        return
+    if len(seen) >= CACHE_SIZES["person_details_doorkeeper"]:
+        seen.clear()
+    seen.add(person_id)
+
+
+def _index_xrefs(gedcom_ctx: GedcomContext, pointer: str, elem):
+    """Record the cross-reference children of a record in gedcom_ctx.xref.
+
+    Only the first child for a given (tag, value) is indexed, matching the
+    first-match semantics of a linear scan.
+    """
+    xref = gedcom_ctx.xref
+    for child in elem.get_child_elements():
+        tag = child.get_tag()
+        if tag in XREF_TAGS:
+            xref.setdefault((pointer, tag, child.get_value()), child)
+
+
 def _rebuild_lookups(gedcom_ctx: GedcomContext):
     logger.info("Rebuilding lookup dictionaries...")
     gedcom_ctx.individual_lookup.clear()
     gedcom_ctx.family_lookup.clear()
     gedcom_ctx.source_lookup.clear()
     gedcom_ctx.note_lookup.clear()
+    gedcom_ctx.xref.clear()
     
     root_elements = gedcom_ctx.gedcom_parser.get_root_child_elements()
     for elem in root_elements:
@@ -93,8 +183,10 @@ def _rebuild_lookups(gedcom_ctx: GedcomContext):
         logger.debug(f"Processing element: Pointer={pointer}, Tag={tag}") # Debug log
         if isinstance(elem, IndividualElement):
             gedcom_ctx.individual_lookup[pointer] = elem
+            _index_xrefs(gedcom_ctx, pointer, elem)
         elif isinstance(elem, FamilyElement):
             gedcom_ctx.family_lookup[pointer] = elem
+            _index_xrefs(gedcom_ctx, pointer, elem)
         elif tag == "SOUR": # Use the 'tag' variable
             gedcom_ctx.source_lookup[pointer] = elem
         elif tag == "NOTE": # Use the 'tag' variable
@@ -2,14 +2,16 @@
 
 import logging
 import os
+import sys
 import tempfile
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from gedcom.element.individual import IndividualElement
 from gedcom.parser import Parser
 import chardet
-from .gedcom_context import GedcomContext, _rebuild_lookups
+from .gedcom_context import GedcomContext, _rebuild_lookups, _admit_person_details
 from .gedcom_models import PersonDetails, PersonRelationships
+from .gedcom_date_utils import parse_genealogy_date, parse_genealogy_dates_bulk
 from .gedcom_utils import normalize_string, _normalize_genealogy_name, _normalize_genealogy_date, _normalize_genealogy_place, PLACE_UTILS_AVAILABLE
 from .gedcom_place_utils import normalize_place_name, extract_geographic_hierarchy
 from .gedcom_constants import EVENT_TYPES, ATTRIBUTE_TYPES
@@ -93,7 +95,10 @@ def load_gedcom_file(file_path: str, gedcom_ctx: GedcomContext) -> bool:
 
         gedcom_ctx.gedcom_file_path = file_path
 
+        # Cached people and adjacency describe the previously loaded tree
+        gedcom_ctx.clear_caches(new_tree=True)
         _rebuild_lookups(gedcom_ctx)
+        _warm_life_event_dates(gedcom_ctx)
 
         logger.info(f"Successfully loaded GEDCOM file: {file_path}")
         return True
@@ -101,6 +106,17 @@ def load_gedcom_file(file_path: str, gedcom_ctx: GedcomContext) -> bool:
         logger.error(f"Error loading GEDCOM file: {e}")
         return False
 
+def _warm_life_event_dates(gedcom_ctx: GedcomContext):
+    """Parse every distinct birth/death date once so later lookups hit the date cache"""
+    date_strings = []
+    for individual in gedcom_ctx.individual_lookup.values():
+        for event in individual.get_child_elements():
+            if event.get_tag() in ("BIRT", "DEAT"):
+                for event_child in event.get_child_elements():
+                    if event_child.get_tag() == "DATE" and event_child.get_value():
+                        date_strings.append(event_child.get_value())
+    parse_genealogy_dates_bulk(date_strings)
+
 def save_gedcom_file(file_path: str, gedcom_ctx: GedcomContext) -> str:
     """Saves the in-memory GEDCOM data back to a file.
 
@@ -137,7 +153,7 @@ def get_person_record(person_id: str, gedcom_ctx) -> Optional[PersonDetails]:
         individual_elem = gedcom_ctx.individual_lookup.get(person_id)
         if individual_elem:
             person_details = _extract_person_details(individual_elem, gedcom_ctx)
-            gedcom_ctx.person_details_cache[person_id] = person_details
+            _admit_person_details(gedcom_ctx, person_id, person_details)
             return person_details
 
         # If not found by ID, try to find by name using lookup dictionary
@@ -155,7 +171,7 @@ def get_person_record(person_id: str, gedcom_ctx) -> Optional[PersonDetails]:
                 person_details = _extract_person_details(individual_elem, gedcom_ctx)
                 # Cache using the actual person ID, not the search term
                 actual_person_id = individual_elem.get_pointer()
-                gedcom_ctx.person_details_cache[actual_person_id] = person_details
+                _admit_person_details(gedcom_ctx, actual_person_id, person_details)
                 return person_details
 
         return None
@@ -165,6 +181,10 @@ def get_person_record(person_id: str, gedcom_ctx) -> Optional[PersonDetails]:
         return None
 
 
+# Stand-in for a missing BIRT/DEAT date; only read, never returned
+_NO_DATE = parse_genealogy_date("")
+
+
 def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDetails:
     """Extract person details from a GEDCOM individual element"""
     person_id = element.get_pointer()
@@ -176,6 +196,8 @@ def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDet
     birth_place = None
     death_date = None
     death_place = None
+    birth_parsed = _NO_DATE
+    death_parsed = _NO_DATE
     gender = None
     occupation = None
 
@@ -204,8 +226,10 @@ def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDet
                 for birt_child in child_elem.get_child_elements():
                     if birt_child.get_tag() == "DATE":
                         birth_date = birt_child.get_value()
-                        # Enhance with our date parsing
-                        birth_date = _normalize_genealogy_date(birth_date) if birth_date else birth_date
+                        # Enhance with our date parsing, keeping the parsed parts
+                        if birth_date:
+                            birth_parsed = parse_genealogy_date(birth_date)
+                            birth_date = birth_parsed.original_text or birth_date
                     elif birt_child.get_tag() == "PLAC":
                         birth_place = birt_child.get_value()
                         # Enhance with our place parsing
@@ -214,8 +238,10 @@ def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDet
                 for deat_child in child_elem.get_child_elements():
                     if deat_child.get_tag() == "DATE":
                         death_date = deat_child.get_value()
-                        # Enhance with our date parsing
-                        death_date = _normalize_genealogy_date(death_date) if death_date else death_date
+                        # Enhance with our date parsing, keeping the parsed parts
+                        if death_date:
+                            death_parsed = parse_genealogy_date(death_date)
+                            death_date = death_parsed.original_text or death_date
                     elif deat_child.get_tag() == "PLAC":
                         death_place = deat_child.get_value()
                         # Enhance with our place parsing
@@ -238,7 +264,7 @@ def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDet
         children = list(relationships.children)
 
     return PersonDetails(
-        id=person_id,
+        id=sys.intern(person_id),
         name=name,
         givn=givn,
         surn=surn,
@@ -246,6 +272,12 @@ def _extract_person_details(element: IndividualElement, gedcom_ctx) -> PersonDet
         birth_place=birth_place,
         death_date=death_date,
         death_place=death_place,
+        birth_year=birth_parsed.year,
+        birth_month=birth_parsed.month,
+        birth_day=birth_parsed.day,
+        death_year=death_parsed.year,
+        death_month=death_parsed.month,
+        death_day=death_parsed.day,
         gender=gender,
         occupation=occupation,
         parents=parents,
@@ -337,12 +369,13 @@ def _get_person_relationships_internal(person_id: str, gedcom_ctx) -> Optional[P
                         if husband_pointer:
                             spouses.add(husband_pointer)
 
+        # IDs are interned so the graph search compares them by identity first
         person_relationships = PersonRelationships(
-            id=person_id,
+            id=sys.intern(person_id),
             gender=gender,
-            parents=sorted(parents),  # Convert set to sorted list for deterministic iteration
-            spouses=sorted(spouses),  # Convert set to sorted list for deterministic iteration
-            children=sorted(children)  # Convert set to sorted list for deterministic iteration
+            parents=tuple(sys.intern(p) for p in sorted(parents)),  # Convert set to sorted tuple for deterministic iteration
+            spouses=tuple(sys.intern(p) for p in sorted(spouses)),  # Convert set to sorted tuple for deterministic iteration
+            children=tuple(sys.intern(p) for p in sorted(children))  # Convert set to sorted tuple for deterministic iteration
         )
         gedcom_ctx.person_relationships_cache[person_id] = person_relationships
         return person_relationships
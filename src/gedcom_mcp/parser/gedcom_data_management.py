@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from typing import List, Set, Dict, Any, Optional
+import re
+from typing import List, Set, Dict, Any, Optional, Tuple
 from gedcom.element.individual import IndividualElement
 from gedcom.element.family import FamilyElement
 from gedcom.element.object import ObjectElement
@@ -8,10 +9,80 @@ from gedcom.parser import Parser
 from gedcom.element.element import Element
 from .gedcom_models import PersonDetails, PersonRelationships
 from .gedcom_utils import _get_gedcom_tag_from_event_type
-from .gedcom_context import _rebuild_lookups
+from .gedcom_context import _rebuild_lookups, XREF_TAGS
 from .gedcom_name_utils import format_gedcom_name_from_string
 
 
+# Tag constants for the child-element checks below
+_FAMC = "FAMC"
+_DATE = "DATE"
+_PLAC = "PLAC"
+_NAME = "NAME"
+_SEX = "SEX"
+_GIVN = "GIVN"
+_SURN = "SURN"
+
+# "Given /Surname/" with an optional trailing suffix; both groups come out stripped
+_GEDCOM_NAME_RE = re.compile(r'^\s*([^/]*?)\s*/\s*([^/]*?)\s*/[^/]*$')
+
+
+def _delete_children(parent, targets) -> None:
+    """Remove the given elements from parent's children in a single pass.
+
+    The child list is rebuilt in place, so removing several elements costs one
+    scan instead of one list.remove() scan per element.
+    """
+    if not targets:
+        return
+    target_ids = {id(target) for target in targets}
+    children = parent.get_child_elements()
+    children[:] = [child for child in children if id(child) not in target_ids]
+
+
+def _add_xref_child(context, parent, tag: str, value: str):
+    """Add a cross-reference child element to parent and record it in context.xref."""
+    element = parent.new_child_element(tag, value=value)
+    context.xref.setdefault((parent.get_pointer(), tag, value), element)
+    return element
+
+
+def _pop_xref_child(context, parent, tag: str, value: str):
+    """Unindex and return parent's child element with the given tag and value.
+
+    Falls back to scanning parent's children when the reference is not in the
+    index (e.g. a duplicate reference). Returns None if there is no such child.
+    """
+    element = context.xref.pop((parent.get_pointer(), tag, value), None)
+    # Only trust the index while the element still holds the value it was indexed under
+    if element is not None and element.get_value() == value:
+        return element
+    for child in parent.get_child_elements():
+        if child.get_tag() == tag and child.get_value() == value:
+            return child
+    return None
+
+
+def _set_xref_value(context, parent, element, value: str) -> None:
+    """Change a cross-reference element's value and move its context.xref entry along with it."""
+    pointer = parent.get_pointer()
+    tag = element.get_tag()
+    old_key = (pointer, tag, element.get_value())
+    if context.xref.get(old_key) is element:
+        del context.xref[old_key]
+    element.set_value(value)
+    context.xref.setdefault((pointer, tag, value), element)
+
+
+def _unindex_xref_children(context, parent, elements) -> None:
+    """Drop index entries that point at elements being removed from parent."""
+    pointer = parent.get_pointer()
+    for element in elements:
+        tag = element.get_tag()
+        if tag in XREF_TAGS:
+            key = (pointer, tag, element.get_value())
+            if context.xref.get(key) is element:
+                del context.xref[key]
+
 
 def _find_next_available_id(prefix: str, lookup_dict: Dict[str, Any]) -> str:
     """Find the next available ID that doesn't exist in any of the lookup dictionaries."""
@@ -53,8 +124,8 @@ def _create_marriage_internal(context, husband_id: str, wife_id: str) -> str:
 
     # Create the new family element
     family = FamilyElement(level=0, pointer=new_family_id, tag="FAM", value="")
-    family.new_child_element("HUSB", value=husband_id)
-    family.new_child_element("WIFE", value=wife_id)
+    _add_xref_child(context, family, "HUSB", husband_id)
+    _add_xref_child(context, family, "WIFE", wife_id)
 
     # Add family to parser and lookup
     context.gedcom_parser.get_root_element().add_child_element(family)
@@ -63,8 +134,8 @@ def _create_marriage_internal(context, husband_id: str, wife_id: str) -> str:
     # Update the FAMS tag on both individuals
     husband = context.individual_lookup[husband_id]
     wife = context.individual_lookup[wife_id]
-    husband.new_child_element("FAMS", value=new_family_id)
-    wife.new_child_element("FAMS", value=new_family_id)
+    _add_xref_child(context, husband, "FAMS", new_family_id)
+    _add_xref_child(context, wife, "FAMS", new_family_id)
     return new_family_id
 
 
@@ -74,8 +145,8 @@ def _add_child_to_family_internal(context, child_id: str, family_id: str) -> Non
     family = context.family_lookup[family_id]
 
     # Add CHIL tag to family and FAMC tag to child
-    family.new_child_element("CHIL", value=child_id)
-    child.new_child_element("FAMC", value=family_id)
+    _add_xref_child(context, family, "CHIL", child_id)
+    _add_xref_child(context, child, "FAMC", family_id)
 
 def _remove_child_from_family_internal(context, child_id: str, family_id: str) -> str:
     """Internal function to remove the link between a child and their family.
@@ -98,24 +169,16 @@ def _remove_child_from_family_internal(context, child_id: str, family_id: str) -
 
     try:
         # Remove CHIL tag from family
-        child_element_to_remove = None
-        for fam_child in family.get_child_elements():
-            if fam_child.get_tag() == "CHIL" and fam_child.get_value() == child_id:
-                child_element_to_remove = fam_child
-                break
+        child_element_to_remove = _pop_xref_child(context, family, "CHIL", child_id)
         if child_element_to_remove:
-            family.get_child_elements().remove(child_element_to_remove)
+            _delete_children(family, [child_element_to_remove])
         else:
             return f"Error: {child_id} is not a child in family {family_id}."
 
         # Remove FAMC tag from child
-        famc_element_to_remove = None
-        for famc in child.get_child_elements():
-            if famc.get_tag() == "FAMC" and famc.get_value() == family_id:
-                famc_element_to_remove = famc
-                break
+        famc_element_to_remove = _pop_xref_child(context, child, "FAMC", family_id)
         if famc_element_to_remove:
-            child.get_child_elements().remove(famc_element_to_remove)
+            _delete_children(child, [famc_element_to_remove])
 
         return f"Successfully removed {child_id} from family {family_id}."
     except Exception as e:
@@ -145,32 +208,23 @@ def _remove_parent_from_family_internal(context, parent_id: str, family_id: str)
     family = context.family_lookup[family_id]
 
     try:
-        # Determine if this is a husband or wife in the family
-        parent_role = None
-        parent_element_to_remove = None
-        
-        # Find HUSB or WIFE tag in family that points to this parent
-        for child in family.get_child_elements():
-            if child.get_tag() in ["HUSB", "WIFE"] and child.get_value() == parent_id:
-                parent_role = child.get_tag()
-                parent_element_to_remove = child
-                break
-        
+        # Find the HUSB or WIFE tag in family that points to this parent
+        parent_role = "HUSB"
+        parent_element_to_remove = _pop_xref_child(context, family, parent_role, parent_id)
+        if not parent_element_to_remove:
+            parent_role = "WIFE"
+            parent_element_to_remove = _pop_xref_child(context, family, parent_role, parent_id)
+
         if not parent_element_to_remove:
             return f"Error: {parent_id} is not a parent (husband or wife) in family {family_id}."
 
         # Remove the HUSB/WIFE tag from family
-        family.get_child_elements().remove(parent_element_to_remove)
+        _delete_children(family, [parent_element_to_remove])
 
         # Remove FAMS tag from parent
-        fams_element_to_remove = None
-        for fams in parent.get_child_elements():
-            if fams.get_tag() == "FAMS" and fams.get_value() == family_id:
-                fams_element_to_remove = fams
-                break
-        
+        fams_element_to_remove = _pop_xref_child(context, parent, "FAMS", family_id)
         if fams_element_to_remove:
-            parent.get_child_elements().remove(fams_element_to_remove)
+            _delete_children(parent, [fams_element_to_remove])
 
         return f"Successfully removed {parent_id} as {parent_role.lower()} from family {family_id}."
     except Exception as e:
@@ -215,7 +269,7 @@ def _remove_event_internal(context, entity_id: str, event_type: str, date_to_mat
                     # Find DATE element in event
                     date_value = None
                     for event_child in child.get_child_elements():
-                        if event_child.get_tag() == "DATE":
+                        if event_child.get_tag() == _DATE:
                             date_value = event_child.get_value()
                             break
                     if date_value and date_value == date_to_match:
@@ -233,7 +287,7 @@ def _remove_event_internal(context, entity_id: str, event_type: str, date_to_mat
                 return f"Error: No {event_type} event found for entity {entity_id}."
 
         # Remove the event element
-        entity.get_child_elements().remove(event_to_remove)
+        _delete_children(entity, [event_to_remove])
         
         return f"Successfully removed {event_type} event from entity {entity_id}."
     except Exception as e:
@@ -263,7 +317,7 @@ def _remove_parents_internal(context, person_id: str) -> str:
         famc_element = None
         family_id = None
         for child in person.get_child_elements():
-            if child.get_tag() == "FAMC":
+            if child.get_tag() == _FAMC:
                 famc_element = child
                 family_id = child.get_value()
                 break
@@ -276,19 +330,16 @@ def _remove_parents_internal(context, person_id: str) -> str:
         
         family = context.family_lookup[family_id]
         
-        # Remove CHIL tag from family (using list remove as remove_child_element doesn't work with element objects)
-        child_element_to_remove = None
-        for fam_child in family.get_child_elements():
-            if fam_child.get_tag() == "CHIL" and fam_child.get_value() == person_id:
-                child_element_to_remove = fam_child
-                break
+        # Remove CHIL tag from family (remove_child_element doesn't work with element objects)
+        child_element_to_remove = _pop_xref_child(context, family, "CHIL", person_id)
         if child_element_to_remove:
-            family.get_child_elements().remove(child_element_to_remove)
+            _delete_children(family, [child_element_to_remove])
         else:
             return f"Error: {person_id} is not a child in family {family_id}."
 
-        # Remove FAMC tag from person (using list remove as remove_child_element doesn't work with element objects)
-        person.get_child_elements().remove(famc_element)
+        # Remove FAMC tag from person (remove_child_element doesn't work with element objects)
+        _unindex_xref_children(context, person, [famc_element])
+        _delete_children(person, [famc_element])
         
         return f"Successfully removed {person_id} from family {family_id} (removing their parents)."
     except Exception as e:
@@ -331,12 +382,9 @@ def _update_event_details_internal(context, entity_id: str, event_type: str, new
 
     # Validate that family events are on family entities and person events on person entities
     family_events = {"MARR", "DIV", "ANUL", "ENGA", "MARB", "MARL", "MARC", "MARS"}
+    # Other events are allowed on families too, since some can be on either (e.g., RESI)
     if event_type_tag in family_events and is_person:
         return f"Error: Family event '{event_type}' must be associated with a family entity, not a person."
-    elif event_type_tag not in family_events and not is_person and is_family:
-        # This is a bit more complex - some events can be on either (e.g., RESI)
-        # For now, we'll allow it but note that certain events should typically be on persons
-        pass
 
     try:
         event_to_update = None
@@ -364,7 +412,7 @@ def _update_event_details_internal(context, entity_id: str, event_type: str, new
                 # Find DATE element within this event
                 date_value = None
                 for date_el in event.get_child_elements():
-                    if date_el.get_tag() == "DATE":
+                    if date_el.get_tag() == _DATE:
                         date_value = date_el.get_value()
                         break
                 if date_value == old_date_to_match:
@@ -380,12 +428,14 @@ def _update_event_details_internal(context, entity_id: str, event_type: str, new
             else:
                 return f"Error: Could not find an '{event_type}' event with date '{old_date_to_match}'."
 
+        event_children = event_to_update.get_child_elements()
+
         # Update date if provided
         if new_date is not None:
             # Find existing DATE element or create new one
             date_el = None
-            for child in event_to_update.get_child_elements():
-                if child.get_tag() == "DATE":
+            for child in event_children:
+                if child.get_tag() == _DATE:
                     date_el = child
                     break
             if date_el:
@@ -397,8 +447,8 @@ def _update_event_details_internal(context, entity_id: str, event_type: str, new
         if new_place is not None:
             # Find existing PLAC element or create new one
             place_el = None
-            for child in event_to_update.get_child_elements():
-                if child.get_tag() == "PLAC":
+            for child in event_children:
+                if child.get_tag() == _PLAC:
                     place_el = child
                     break
             if place_el:
@@ -411,8 +461,8 @@ def _update_event_details_internal(context, entity_id: str, event_type: str, new
         return f"Error updating event: {e}"
 
 
-def _create_note_internal(context, note_text: str) -> str:
-    """Create a new note with a unique ID."""
+def _create_note_raw(context, note_text: str) -> Tuple[str, Element]:
+    """Create a new note with a unique ID and return both the ID and the note element."""
     # Generate a new unique note ID that doesn't exist in any lookup dictionary
     new_note_id = _find_next_available_id("@N", context.note_lookup)
 
@@ -422,7 +472,13 @@ def _create_note_internal(context, note_text: str) -> str:
     # Add note to parser and lookup
     context.gedcom_parser.get_root_element().add_child_element(note)
     context.note_lookup[new_note_id] = note
-    
+
+    return new_note_id, note
+
+
+def _create_note_internal(context, note_text: str) -> str:
+    """Create a new note with a unique ID."""
+    new_note_id, _ = _create_note_raw(context, note_text)
     return new_note_id
 
 
@@ -462,7 +518,7 @@ def batch_update_person_attributes(context, updates: list) -> dict:
             attribute_tag = update.get("attribute_tag")
             new_value = update.get("new_value")
             
-            if not all([person_id, attribute_tag, new_value is not None]):
+            if not person_id or not attribute_tag or new_value is None:
                 results["failed"] += 1
                 results["errors"].append({
                     "index": i,
@@ -471,13 +527,13 @@ def batch_update_person_attributes(context, updates: list) -> dict:
                 continue
             
             # Perform update
-            result = _update_person_attribute_internal(context, person_id, attribute_tag, new_value)
-            if "Error" in result:
+            ok, message = _update_person_attribute_internal(context, person_id, attribute_tag, new_value)
+            if not ok:
                 results["failed"] += 1
                 results["errors"].append({
                     "index": i,
                     "person_id": person_id,
-                    "error": result
+                    "error": message
                 })
             else:
                 results["successful"] += 1
@@ -496,8 +552,6 @@ def batch_update_person_attributes(context, updates: list) -> dict:
     
     return results
 
-    return new_note_id
-
 
 def _add_note_to_entity_internal(context, entity_id: str, note_text: str = None, note_id: str = None) -> str:
     """Internal function to add a note to a person or family.
@@ -523,30 +577,29 @@ def _add_note_to_entity_internal(context, entity_id: str, note_text: str = None,
         return f"Error: Entity with ID {entity_id} not found."
 
     try:
-        # If no note_id provided, create a new note
-        if not note_id:
-            note_id = _create_note_internal(context, note_text)
-        else:
+        # Resolve an existing note once, before touching the entity
+        note = context.note_lookup.get(note_id) if note_id else None
+        if note_id and note is None:
+            return f"Error: Note with ID {note_id} not found."
+
+        if note is not None:
             # If note_id is provided, we're referencing an existing note
             # In this case, we should append the note_text to the existing note if provided
-            if note_id in context.note_lookup and note_text:
-                note = context.note_lookup[note_id]
-                if note.get_value():
-                    note.set_value(note.get_value() + "\n" + note_text)
-                else:
-                    note.set_value(note_text)
+            if note_text:
+                current_text = note.get_value()
+                note.set_value(current_text + "\n" + note_text if current_text else note_text)
+        else:
+            # If no note_id provided, create a new note
+            note_id, _ = _create_note_raw(context, note_text)
 
         # Create a reference to the note
-        if note_id not in context.note_lookup:
-            return f"Error: Note with ID {note_id} not found."
-            
-        entity.new_child_element("NOTE", value=note_id)
+        _add_xref_child(context, entity, "NOTE", note_id)
         return f"Successfully added note reference {note_id} to entity {entity_id}."
     except Exception as e:
         return f"Error adding note: {e}"
 
 
-def _update_person_attribute_internal(context, person_id: str, attribute_tag: str, new_value: str) -> str:
+def _update_person_attribute_internal(context, person_id: str, attribute_tag: str, new_value: str) -> Tuple[bool, str]:
     """Internal function to update a person's attribute.
     Args:
         context: The GEDCOM context.
@@ -554,10 +607,10 @@ def _update_person_attribute_internal(context, person_id: str, attribute_tag: st
         attribute_tag (str): The tag of the attribute to update (e.g., 'OCCU' for occupation).
         new_value (str): The new value for the attribute.
     Returns:
-        str: Success or error message.
+        Tuple[bool, str]: Whether the update succeeded, and a success or error message.
     """
     if person_id not in context.individual_lookup:
-        return f"Error: Person with ID {person_id} not found."
+        return False, f"Error: Person with ID {person_id} not found."
 
     individual = context.individual_lookup[person_id]
     
@@ -566,16 +619,22 @@ def _update_person_attribute_internal(context, person_id: str, attribute_tag: st
         # Iterate through child elements to find the attribute
         for child in individual.get_child_elements():
             if child.get_tag() == attribute_tag:
-                child.set_value(new_value)
+                if attribute_tag in XREF_TAGS:
+                    _set_xref_value(context, individual, child, new_value)
+                else:
+                    child.set_value(new_value)
                 found = True
                 break
         if not found:
             # Add new attribute if not found
-            individual.new_child_element(attribute_tag, value=new_value)
+            if attribute_tag in XREF_TAGS:
+                _add_xref_child(context, individual, attribute_tag, new_value)
+            else:
+                individual.new_child_element(attribute_tag, value=new_value)
         
-        return f"Successfully updated attribute {attribute_tag} for person {person_id}."
+        return True, f"Successfully updated attribute {attribute_tag} for person {person_id}."
     except Exception as e:
-        return f"Error updating person attribute: {e}"
+        return False, f"Error updating person attribute: {e}"
 
 def _remove_person_attribute_internal(context, person_id: str, attribute_tag: str) -> str:
     """Internal function to remove an attribute from a person.
@@ -599,8 +658,8 @@ def _remove_person_attribute_internal(context, person_id: str, attribute_tag: st
                 elements_to_remove.append(child)
         
         # Remove the elements
-        for element in elements_to_remove:
-            individual.get_child_elements().remove(element)
+        _unindex_xref_children(context, individual, elements_to_remove)
+        _delete_children(individual, elements_to_remove)
         
         if elements_to_remove:
             return f"Successfully removed attribute {attribute_tag} from person {person_id}."
@@ -623,12 +682,13 @@ def _update_person_details_internal(context, person_id: str, name: Optional[str]
         return f"Error: Person with ID {person_id} not found."
 
     person = context.individual_lookup[person_id]
+    person_children = person.get_child_elements()
 
     try:
         if name is not None:
             name_element = None
-            for child in person.get_child_elements():
-                if child.get_tag() == "NAME":
+            for child in person_children:
+                if child.get_tag() == _NAME:
                     name_element = child
                     break
             
@@ -636,23 +696,24 @@ def _update_person_details_internal(context, person_id: str, name: Optional[str]
                 givn_element = None
                 surn_element = None
                 for child_of_name in name_element.get_child_elements():
-                    if child_of_name.get_tag() == "GIVN":
+                    name_tag = child_of_name.get_tag()
+                    if name_tag == _GIVN:
                         givn_element = child_of_name
-                    elif child_of_name.get_tag() == "SURN":
+                    elif name_tag == _SURN:
                         surn_element = child_of_name
                 
                 if givn_element and surn_element:
-                    parts = name.split('/')
-                    if len(parts) == 3 and parts[0].strip() and parts[1].strip():
-                        given_name = parts[0].strip()
-                        surname = parts[1].strip()
-                    elif len(parts) == 1:
-                        name_parts = name.rsplit(' ', 1)
+                    match = _GEDCOM_NAME_RE.match(name)
+                    if match:
+                        # Either part may be empty, e.g. a surname-only "/Doe/"
+                        given_name, surname = match.group(1), match.group(2)
+                    else:
+                        # Stray slashes (e.g. an unclosed "John /Doe") must not end up in GIVN/SURN
+                        name_parts = ' '.join(name.replace('/', ' ').split()).rsplit(' ', 1)
                         if len(name_parts) == 2:
-                            given_name = name_parts[0].strip()
-                            surname = name_parts[1].strip()
+                            given_name, surname = name_parts
                         else:
-                            given_name = name.strip()
+                            given_name = name_parts[0]
                             surname = ""
 
                     givn_element.set_value(given_name)
@@ -664,21 +725,13 @@ def _update_person_details_internal(context, person_id: str, name: Optional[str]
             else:
                 formatted_name = format_gedcom_name_from_string(name)
                 person.new_child_element("NAME", value=formatted_name)
-        elif name == "":
-            name_element = None
-            for child in person.get_child_elements():
-                if child.get_tag() == "NAME":
-                    name_element = child
-                    break
-            if name_element:
-                name_element.set_value("")
         
         if gender is not None:
             if gender.upper() not in ['M', 'F']:
                 return "Error: Gender must be 'M' or 'F'."
             sex_element = None
-            for child in person.get_child_elements():
-                if child.get_tag() == "SEX":
+            for child in person_children:
+                if child.get_tag() == _SEX:
                     sex_element = child
                     break
             if sex_element:
@@ -730,7 +783,7 @@ def _delete_note_entity_internal(context, note_id: str) -> str:
     try:
         # Remove the note element from the parser
         note_element = context.note_lookup[note_id]
-        context.gedcom_parser.get_root_element().get_child_elements().remove(note_element)
+        _delete_children(context.gedcom_parser.get_root_element(), [note_element])
         
         # Remove from note lookup
         del context.note_lookup[note_id]
@@ -768,8 +821,7 @@ def _new_empty_gedcom_internal(context) -> str:
     context.family_lookup.clear()
     context.source_lookup.clear()
     context.note_lookup.clear()
-    context.person_relationships_cache.clear()
-    context.person_details_cache.clear()
-    context.neighbor_cache.clear()
+    context.xref.clear()
+    context.clear_caches(new_tree=True)
     
     return "Successfully created new empty GEDCOM context"
@@ -4,11 +4,12 @@ This module provides enhanced date parsing capabilities that handle
 genealogy-specific date formats commonly found in GEDCOM files.
 """
 
-import re
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Callable
 from datetime import datetime
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class DateCertainty(Enum):
@@ -22,51 +23,177 @@ class DateCertainty(Enum):
     ESTIMATED = "estimated"
 
 
-@dataclass
+# Maximum number of distinct date strings kept by the parse cache
+DATE_CACHE_SIZE = 65536
+
+_QUALIFIER_CERTAINTY = {
+    "BEFORE": DateCertainty.BEFORE, "BEF": DateCertainty.BEFORE,
+    "AFTER": DateCertainty.AFTER, "AFT": DateCertainty.AFTER,
+    "ABOUT": DateCertainty.ABOUT, "ABT": DateCertainty.ABOUT,
+    "CALCULATED": DateCertainty.CALCULATED, "CAL": DateCertainty.CALCULATED,
+    "ESTIMATED": DateCertainty.ESTIMATED, "EST": DateCertainty.ESTIMATED,
+}
+_RANGE_KEYWORDS = frozenset({"BETWEEN", "BET"})
+_SHORT_QUALIFIER_PREFIXES = frozenset({"ABT ", "BEF ", "AFT "})
+
+# Token classes produced by _tokenize_date, one character per token:
+#   Y  four-digit number        N  one- or two-digit number    D  other number
+#   Q  qualifier keyword        B  range keyword               &  "AND" or "&"
+#   M  three-letter word        A  other word
+#   /  date separator "/" or "-"; "(" and ")" stand for themselves; ? anything else
+_DUAL_CLASSES = "Y(Y)"        # "1880 (1881)"
+_RANGE_CLASSES = "BY&Y"       # "BET 1850 AND 1860"
+_QUALIFIED_CLASSES = "QY"     # "ABT 1850"
+_DMY_CLASSES = "NMY"          # "15 MAR 1850"
+_MDY_CLASSES = "N/N/Y"        # "03/15/1850"
+
+
+def _classify_word(word: str) -> str:
+    if word in _QUALIFIER_CERTAINTY:
+        return "Q"
+    if word in _RANGE_KEYWORDS:
+        return "B"
+    if word == "AND":
+        return "&"
+    return "M" if len(word) == 3 else "A"
+
+
+def _tokenize_date(date_string: str) -> Tuple[str, List[str]]:
+    """Split an upper-cased date string into tokens in a single left-to-right pass.
+
+    Returns the token classes as a string (see the table above) together with
+    the token texts, so date shapes can be located with str.find().
+    """
+    classes = []
+    texts = []
+    i = 0
+    length = len(date_string)
+    while i < length:
+        char = date_string[i]
+        if "0" <= char <= "9":
+            j = i + 1
+            while j < length and "0" <= date_string[j] <= "9":
+                j += 1
+            digits = j - i
+            classes.append("Y" if digits == 4 else "N" if digits <= 2 else "D")
+        elif "A" <= char <= "Z":
+            j = i + 1
+            while j < length and "A" <= date_string[j] <= "Z":
+                j += 1
+            classes.append(_classify_word(date_string[i:j]))
+        elif char.isspace():
+            i += 1
+            continue
+        else:
+            j = i + 1
+            if char == "-":
+                classes.append("/")
+            else:
+                classes.append(char if char in "/()&" else "?")
+        texts.append(date_string[i:j])
+        i = j
+    return "".join(classes), texts
+
+
+# Keys of GenealogyDate.to_dict(), in field order
+_DATE_DICT_KEYS = ("original_text", "certainty", "year", "month", "day",
+                   "year_end", "month_end", "day_end", "qualifier")
+
+
+def _packed_part(packed_attr: str, scale: int, width: int) -> property:
+    """Property exposing one decimal lane of a packed year*10000 + month*100 + day int.
+
+    A zero lane reads back as None, matching the "unknown" meaning of the old fields.
+    """
+    def getter(self) -> Optional[int]:
+        return getattr(self, packed_attr) // scale % width or None
+    
+    def setter(self, value: Optional[int]) -> None:
+        packed = getattr(self, packed_attr)
+        setattr(self, packed_attr, packed + ((value or 0) - packed // scale % width) * scale)
+    
+    return property(getter, setter)
+
+
+@dataclass(slots=True, init=False, repr=False)
 class GenealogyDate:
-    """Represents a parsed genealogy date with all relevant information."""
+    """Represents a parsed genealogy date with all relevant information.
+    
+    The start and end dates are each stored as one packed int
+    (year*10000 + month*100 + day, 0 for unknown parts) and exposed through
+    the year/month/day and year_end/month_end/day_end properties.
+    """
     original_text: str
     certainty: DateCertainty
-    year: Optional[int] = None
-    month: Optional[int] = None
-    day: Optional[int] = None
-    year_end: Optional[int] = None  # For date ranges
-    month_end: Optional[int] = None
-    day_end: Optional[int] = None
-    qualifier: Optional[str] = None  # Additional qualifiers like "ABT", "BEF", etc.
+    qualifier: Optional[str]  # Additional qualifiers like "ABT", "BEF", etc.
+    _start: int
+    _end: int  # For date ranges
+    
+    year = _packed_part("_start", 10000, 100000)
+    month = _packed_part("_start", 100, 100)
+    day = _packed_part("_start", 1, 100)
+    year_end = _packed_part("_end", 10000, 100000)
+    month_end = _packed_part("_end", 100, 100)
+    day_end = _packed_part("_end", 1, 100)
+    
+    def __init__(self, original_text: str, certainty: DateCertainty,
+                 year: Optional[int] = None, month: Optional[int] = None, day: Optional[int] = None,
+                 year_end: Optional[int] = None, month_end: Optional[int] = None, day_end: Optional[int] = None,
+                 qualifier: Optional[str] = None):
+        self.original_text = original_text
+        self.certainty = certainty
+        self.qualifier = qualifier
+        self._start = (year or 0) * 10000 + (month or 0) * 100 + (day or 0)
+        self._end = (year_end or 0) * 10000 + (month_end or 0) * 100 + (day_end or 0)
+    
+    def __repr__(self) -> str:
+        return (f"GenealogyDate(original_text={self.original_text!r}, certainty={self.certainty}, "
+                f"year={self.year}, month={self.month}, day={self.day}, "
+                f"year_end={self.year_end}, month_end={self.month_end}, day_end={self.day_end}, "
+                f"qualifier={self.qualifier!r})")
     
     def __str__(self) -> str:
         """Return a string representation of the date."""
-        if self.certainty == DateCertainty.EXACT:
-            if self.year and self.month and self.day:
-                return f"{self.day:02d}/{self.month:02d}/{self.year}"
-            elif self.year and self.month:
-                return f"{self.month:02d}/{self.year}"
-            elif self.year:
-                return str(self.year)
-        elif self.certainty == DateCertainty.BEFORE and self.year:
-            return f"Before {self.year}"
-        elif self.certainty == DateCertainty.AFTER and self.year:
-            return f"After {self.year}"
-        elif self.certainty == DateCertainty.ABOUT and self.year:
-            return f"About {self.year}"
-        elif self.certainty == DateCertainty.BETWEEN and self.year and self.year_end:
-            return f"Between {self.year} and {self.year_end}"
-        return self.original_text
+        formatter = _STR_FORMATTERS.get(self.certainty)
+        text = formatter(self) if formatter else None
+        return text or self.original_text
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return {
-            "original_text": self.original_text,
-            "certainty": self.certainty.value,
-            "year": self.year,
-            "month": self.month,
-            "day": self.day,
-            "year_end": self.year_end,
-            "month_end": self.month_end,
-            "day_end": self.day_end,
-            "qualifier": self.qualifier
-        }
+        return dict(zip(_DATE_DICT_KEYS, (
+            self.original_text, self.certainty.value, self.year, self.month, self.day,
+            self.year_end, self.month_end, self.day_end, self.qualifier
+        )))
+
+
+def _format_exact(date: GenealogyDate) -> Optional[str]:
+    if date.year and date.month and date.day:
+        return f"{date.day:02d}/{date.month:02d}/{date.year}"
+    if date.year and date.month:
+        return f"{date.month:02d}/{date.year}"
+    if date.year:
+        return str(date.year)
+    return None
+
+
+# Per-certainty formatters; a None result falls back to the original text
+_STR_FORMATTERS: Dict[DateCertainty, Callable[[GenealogyDate], Optional[str]]] = {
+    DateCertainty.EXACT: _format_exact,
+    DateCertainty.BEFORE: lambda d: f"Before {d.year}" if d.year else None,
+    DateCertainty.AFTER: lambda d: f"After {d.year}" if d.year else None,
+    DateCertainty.ABOUT: lambda d: f"About {d.year}" if d.year else None,
+    DateCertainty.BETWEEN: lambda d: f"Between {d.year} and {d.year_end}" if d.year and d.year_end else None,
+}
+
+_CERTAINTY_FORMATTERS: Dict[DateCertainty, Callable[[GenealogyDate], str]] = {
+    DateCertainty.EXACT: lambda d: "Exact date",
+    DateCertainty.BEFORE: lambda d: f"Before {d.year} (approximate)",
+    DateCertainty.AFTER: lambda d: f"After {d.year} (approximate)",
+    DateCertainty.ABOUT: lambda d: f"About {d.year} (approximate)",
+    DateCertainty.BETWEEN: lambda d: f"Between {d.year} and {d.year_end} (approximate range)",
+    DateCertainty.CALCULATED: lambda d: f"Calculated date: {d.year}",
+    DateCertainty.ESTIMATED: lambda d: f"Estimated date: {d.year}",
+}
 
 
 def parse_genealogy_date(date_string: str) -> GenealogyDate:
@@ -91,14 +218,61 @@ def parse_genealogy_date(date_string: str) -> GenealogyDate:
     if not date_string or not isinstance(date_string, str):
         return GenealogyDate(original_text="", certainty=DateCertainty.EXACT)
     
+    # The cached instance is shared, so hand out a copy the caller may modify
+    return copy(_parse_genealogy_date_cached(date_string))
+
+
+def parse_genealogy_dates_bulk(date_strings: List[str]) -> List[GenealogyDate]:
+    """Parse many date strings at once, parsing each distinct string only once.
+    
+    Args:
+        date_strings: The date strings to parse
+        
+    Returns:
+        GenealogyDate objects in the same order as the input. Each distinct string
+        gets its own copy, detached from the parse cache, but repeated strings share
+        that copy, so callers must not mutate the results; use parse_genealogy_date
+        for an independent object.
+    """
+    unique = {}
+    for date_string in date_strings:
+        if date_string not in unique:
+            unique[date_string] = parse_genealogy_date(date_string)
+    return [unique[date_string] for date_string in date_strings]
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_genealogy_date_cached(date_string: str) -> GenealogyDate:
+    """Parse a non-empty date string; results are memoized since GEDCOM dates repeat a lot."""
     original = date_string.strip()
     date_string = original.upper()
     
+    # Fast paths for the most common shapes: "1850" and "ABT 1850"/"BEF 1850"/"AFT 1850"
+    if len(date_string) == 4:
+        if date_string.isdigit() and date_string.isascii():
+            return GenealogyDate(
+                original_text=original,
+                certainty=DateCertainty.EXACT,
+                year=int(date_string)
+            )
+    elif len(date_string) == 8 and date_string[:4] in _SHORT_QUALIFIER_PREFIXES:
+        year_text = date_string[4:]
+        if year_text.isdigit() and year_text.isascii():
+            qualifier = date_string[:3]
+            return GenealogyDate(
+                original_text=original,
+                certainty=_QUALIFIER_CERTAINTY[qualifier],
+                year=int(year_text),
+                qualifier=qualifier
+            )
+    
+    classes, texts = _tokenize_date(date_string)
+    
     # Handle dual dates first (e.g., "1880 (1881)")
-    dual_match = re.search(r'(\d{4})\s*$$(\d{4})$$', date_string)
-    if dual_match:
+    pos = classes.find(_DUAL_CLASSES)
+    if pos >= 0:
         # For dual dates, we take the first year as primary
-        year = int(dual_match.group(1))
+        year = int(texts[pos])
         return GenealogyDate(
             original_text=original,
             certainty=DateCertainty.EXACT,
@@ -107,10 +281,10 @@ def parse_genealogy_date(date_string: str) -> GenealogyDate:
         )
     
     # Handle date ranges (BETWEEN/BET)
-    bet_match = re.search(r'(?:BETWEEN|BET)\s+(\d{4})\s+(?:AND|&)\s+(\d{4})', date_string)
-    if bet_match:
-        year1 = int(bet_match.group(1))
-        year2 = int(bet_match.group(2))
+    pos = classes.find(_RANGE_CLASSES)
+    if pos >= 0:
+        year1 = int(texts[pos + 1])
+        year2 = int(texts[pos + 3])
         return GenealogyDate(
             original_text=original,
             certainty=DateCertainty.BETWEEN,
@@ -118,113 +292,82 @@ def parse_genealogy_date(date_string: str) -> GenealogyDate:
             year_end=max(year1, year2)
         )
     
-    # Handle BEFORE/BEF
-    bef_match = re.search(r'(?:BEFORE|BEF)\s*(\d{4})', date_string)
-    if bef_match:
-        year = int(bef_match.group(1))
-        return GenealogyDate(
-            original_text=original,
-            certainty=DateCertainty.BEFORE,
-            year=year,
-            qualifier=re.search(r'(?:BEFORE|BEF)', date_string).group(0)
-        )
-    
-    # Handle AFTER/AFT
-    aft_match = re.search(r'(?:AFTER|AFT)\s*(\d{4})', date_string)
-    if aft_match:
-        year = int(aft_match.group(1))
+    # Handle BEFORE/AFTER/ABOUT/CALCULATED/ESTIMATED and their abbreviations
+    pos = classes.find(_QUALIFIED_CLASSES)
+    if pos >= 0:
+        qualifier = texts[pos]
         return GenealogyDate(
             original_text=original,
-            certainty=DateCertainty.AFTER,
-            year=year,
-            qualifier=re.search(r'(?:AFTER|AFT)', date_string).group(0)
+            certainty=_QUALIFIER_CERTAINTY[qualifier],
+            year=int(texts[pos + 1]),
+            qualifier=qualifier
         )
     
-    # Handle ABOUT/ABT
-    abt_match = re.search(r'(?:ABOUT|ABT)\s*(\d{4})', date_string)
-    if abt_match:
-        year = int(abt_match.group(1))
-        return GenealogyDate(
-            original_text=original,
-            certainty=DateCertainty.ABOUT,
-            year=year,
-            qualifier=re.search(r'(?:ABOUT|ABT)', date_string).group(0)
-        )
-    
-    # Handle CALCULATED/CAL
-    cal_match = re.search(r'(?:CALCULATED|CAL)\s*(\d{4})', date_string)
-    if cal_match:
-        year = int(cal_match.group(1))
-        return GenealogyDate(
-            original_text=original,
-            certainty=DateCertainty.CALCULATED,
-            year=year,
-            qualifier=re.search(r'(?:CALCULATED|CAL)', date_string).group(0)
-        )
-    
-    # Handle ESTIMATED/EST
-    est_match = re.search(r'(?:ESTIMATED|EST)\s*(\d{4})', date_string)
-    if est_match:
-        year = int(est_match.group(1))
+    # Handle exact dates with various formats; the first matching shape wins
+    # Pattern for "DD MMM YYYY" (e.g., "15 MAR 1850")
+    pos = classes.find(_DMY_CLASSES)
+    if pos >= 0:
         return GenealogyDate(
             original_text=original,
-            certainty=DateCertainty.ESTIMATED,
-            year=year,
-            qualifier=re.search(r'(?:ESTIMATED|EST)', date_string).group(0)
+            certainty=DateCertainty.EXACT,
+            year=int(texts[pos + 2]),
+            month=_month_to_number(texts[pos + 1]),
+            day=int(texts[pos])
         )
     
-    # Handle exact dates with various formats
-    # Try to extract year, month, day
-    year = None
-    month = None
-    day = None
-    
-    # Pattern for "DD MMM YYYY" (e.g., "15 MAR 1850")
-    dmy_match = re.search(r'(\d{1,2})\s+([A-Z]{3})\s+(\d{4})', date_string)
-    if dmy_match:
-        day = int(dmy_match.group(1))
-        month_str = dmy_match.group(2)
-        year = int(dmy_match.group(3))
-        month = _month_to_number(month_str)
-    
     # Pattern for "MM/DD/YYYY" or "DD/MM/YYYY" (simple heuristics)
-    mdy_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', date_string)
-    if mdy_match and not year:  # Only if not already found
-        part1 = int(mdy_match.group(1))
-        part2 = int(mdy_match.group(2))
-        year = int(mdy_match.group(3))
+    pos = classes.find(_MDY_CLASSES)
+    if pos >= 0:
+        part1 = int(texts[pos])
+        part2 = int(texts[pos + 2])
+        year = int(texts[pos + 4])
         
         # Simple heuristic: if first part > 12, it's day/month/year
         # Otherwise, assume month/day/year for US format
         if part1 > 12:
-            day = part1
-            month = part2
+            day, month = part1, part2
         else:
-            month = part1
-            day = part2
+            month, day = part1, part2
+        return GenealogyDate(
+            original_text=original,
+            certainty=DateCertainty.EXACT,
+            year=year,
+            month=month,
+            day=day
+        )
     
     # Pattern for just year (e.g., "1850")
-    year_only_match = re.search(r'\b(\d{4})\b', date_string)
-    if year_only_match and not year:
-        year = int(year_only_match.group(1))
-    
+    pos = classes.find("Y")
     return GenealogyDate(
         original_text=original,
         certainty=DateCertainty.EXACT,
-        year=year,
-        month=month,
-        day=day
+        year=int(texts[pos]) if pos >= 0 else None
     )
 
 
+_MONTH_ABBREVIATIONS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+                        "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+
+def _month_hash(month_str: str) -> int:
+    # Collision-free over the twelve abbreviations above
+    return ((ord(month_str[0]) << 2) ^ ord(month_str[1]) ^ (ord(month_str[2]) << 1)) & 31
+
+
+# Slot -> (abbreviation, month number); the abbreviation rejects non-month words
+_MONTH_TABLE = [("", None)] * 32
+for _number, _abbreviation in enumerate(_MONTH_ABBREVIATIONS, 1):
+    _MONTH_TABLE[_month_hash(_abbreviation)] = (_abbreviation, _number)
+assert sum(1 for entry in _MONTH_TABLE if entry[1]) == 12
+del _number, _abbreviation
+
+
 def _month_to_number(month_str: str) -> Optional[int]:
     """Convert a 3-letter month abbreviation to a number."""
-    months = {
-        'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4,
-        'MAY': 5, 'JUN': 6, 'JUL': 7, 'AUG': 8,
-        'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
-    }
-    return months.get(month_str)
+    if len(month_str) != 3:
+        return None
+    abbreviation, number = _MONTH_TABLE[_month_hash(month_str)]
+    return number if abbreviation == month_str else None
 
 
 def validate_date_consistency(birth_date: Optional[str], death_date: Optional[str]) -> Tuple[bool, str]:
@@ -242,24 +385,35 @@ def validate_date_consistency(birth_date: Optional[str], death_date: Optional[st
     
     birth_parsed = parse_genealogy_date(birth_date) if birth_date else None
     death_parsed = parse_genealogy_date(death_date) if death_date else None
+    return validate_date_consistency_parsed(birth_parsed, death_parsed)
+
+
+def validate_date_consistency_parsed(birth: Optional[GenealogyDate], death: Optional[GenealogyDate]) -> Tuple[bool, str]:
+    """Validate that already-parsed birth and death dates are consistent.
     
+    Args:
+        birth: Parsed birth date, or None if unknown
+        death: Parsed death date, or None if unknown
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
     # If we can't parse either date, we can't validate
-    if (birth_date and not birth_parsed.year) or (death_date and not death_parsed.year):
+    if not birth or not death or not birth.year or not death.year:
         return True, ""
     
     # Check if death date is before birth date
-    if birth_parsed and death_parsed and birth_parsed.year and death_parsed.year:
-        if death_parsed.year < birth_parsed.year:
-            return False, f"Death date ({death_parsed.year}) is before birth date ({birth_parsed.year})"
-        
-        # Also check if they're the same year but death month/day is before birth
-        if death_parsed.year == birth_parsed.year:
-            if death_parsed.month and birth_parsed.month and death_parsed.month < birth_parsed.month:
-                return False, f"Death date is before birth date in the same year"
-            if (death_parsed.month == birth_parsed.month and 
-                death_parsed.day and birth_parsed.day and 
-                death_parsed.day < birth_parsed.day):
-                return False, f"Death date is before birth date in the same month"
+    if death.year < birth.year:
+        return False, f"Death date ({death.year}) is before birth date ({birth.year})"
+    
+    # Also check if they're the same year but death month/day is before birth
+    if death.year == birth.year:
+        if death.month and birth.month and death.month < birth.month:
+            return False, f"Death date is before birth date in the same year"
+        if (death.month == birth.month and 
+            death.day and birth.day and 
+            death.day < birth.day):
+            return False, f"Death date is before birth date in the same month"
     
     return True, ""
 
@@ -274,23 +428,8 @@ def get_date_certainty_level(date_string: str) -> str:
         A description of the date's certainty level
     """
     parsed = parse_genealogy_date(date_string)
-    
-    if parsed.certainty == DateCertainty.EXACT:
-        return "Exact date"
-    elif parsed.certainty == DateCertainty.BEFORE:
-        return f"Before {parsed.year} (approximate)"
-    elif parsed.certainty == DateCertainty.AFTER:
-        return f"After {parsed.year} (approximate)"
-    elif parsed.certainty == DateCertainty.ABOUT:
-        return f"About {parsed.year} (approximate)"
-    elif parsed.certainty == DateCertainty.BETWEEN:
-        return f"Between {parsed.year} and {parsed.year_end} (approximate range)"
-    elif parsed.certainty == DateCertainty.CALCULATED:
-        return f"Calculated date: {parsed.year}"
-    elif parsed.certainty == DateCertainty.ESTIMATED:
-        return f"Estimated date: {parsed.year}"
-    
-    return "Unknown certainty level"
+    formatter = _CERTAINTY_FORMATTERS.get(parsed.certainty)
+    return formatter(parsed) if formatter else "Unknown certainty level"
 
 
 # Example usage and testing
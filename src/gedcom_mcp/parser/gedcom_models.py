@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from typing import List, Optional
+import sys
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
 from functools import total_ordering
 from dataclasses import dataclass, field
@@ -16,6 +17,13 @@ class PersonDetails(BaseModel):
     birth_place: Optional[str] = None
     death_date: Optional[str] = None
     death_place: Optional[str] = None
+    # Parsed once at extraction so date checks need not re-parse the strings
+    birth_year: Optional[int] = None
+    birth_month: Optional[int] = None
+    birth_day: Optional[int] = None
+    death_year: Optional[int] = None
+    death_month: Optional[int] = None
+    death_day: Optional[int] = None
     gender: Optional[str] = None
     occupation: Optional[str] = None
     parents: List[str] = Field(default_factory=list)
@@ -23,13 +31,19 @@ class PersonDetails(BaseModel):
     children: List[str] = Field(default_factory=list)
 
 
-class PersonRelationships(BaseModel):
-    """Model for person relationships, optimized for graph traversal"""
+@dataclass(slots=True)
+class PersonRelationships:
+    """Model for person relationships, optimized for graph traversal.
+
+    Internal only and never serialized, so it is a plain slotted dataclass
+    rather than a validated Pydantic model.
+    """
     id: str
     gender: Optional[str] = None
-    parents: List[str] = Field(default_factory=list)
-    spouses: List[str] = Field(default_factory=list)
-    children: List[str] = Field(default_factory=list)
+    # Read-only during traversal, so tuples rather than lists
+    parents: Tuple[str, ...] = ()
+    spouses: Tuple[str, ...] = ()
+    children: Tuple[str, ...] = ()
 
 
 # --- Constants for Heuristics ---
@@ -39,9 +53,11 @@ BIRTH_YEAR_HEURISTIC_FACTOR = 25.0   # The factor to scale the birth year distan
 NO_BIRTH_YEAR_PENALTY = 9999         # A large value to deprioritize nodes without a birth year.
 HAS_BIRTH_YEAR_BONUS = 5000          # A value to prioritize nodes with a birth year over those without, even if the target year is unknown.
 
+_MISSING = object()  # Cache-miss sentinel for birth_year_cache lookups
+
 
 @total_ordering
-@dataclass
+@dataclass(slots=True)
 class NodePriority:
     """
     Represents the priority of a node in the search queue.
@@ -54,23 +70,31 @@ class NodePriority:
     2.  Simplicity: The complex comparison logic in __lt__ is replaced with a
         more readable and Pythonic tuple comparison.
     3.  Encapsulation: Heuristic calculations are done once in __post_init__.
+    4.  Speed: The sort key tuple is built once per node, not once per comparison.
     """
     distance: int
     person_id: str
-    path: List[str]
-    target_birth_year: Optional[int]
+    # Only read by init_heuristics; plain distance ordering leaves it unset
+    target_birth_year: Optional[int] = None
 
     # These fields are computed once and used for comparison.
     # They are excluded from the default __repr__ for brevity.
     _adjusted_distance: float = field(init=False, repr=False)
     _birth_year_distance: int = field(init=False, repr=False)
+    _key: tuple = field(init=False, repr=False)
+
+    # Nodes are mutable (init_heuristics), so they must not be hashable
+    __hash__ = None
 
     def __post_init__(self):
         """
         Initialize with default values. Call init_heuristics() with gedcom_ctx to calculate proper values.
         """
+        # Interned IDs let the tie-break compare by identity before comparing characters
+        self.person_id = sys.intern(self.person_id)
         self._birth_year_distance = NO_BIRTH_YEAR_PENALTY
         self._adjusted_distance = float(self.distance)
+        self._key = (self._adjusted_distance, self._birth_year_distance, self.person_id)
 
     def init_heuristics(self, gedcom_ctx):
         """
@@ -78,7 +102,13 @@ class NodePriority:
         """
         from .gedcom_utils import extract_birth_year
 
-        birth_year = extract_birth_year(self.person_id, gedcom_ctx)
+        # The same person is pushed once per relaxed edge, so memoize per context.
+        # None is a valid answer, hence the sentinel.
+        cache = gedcom_ctx.birth_year_cache
+        birth_year = cache.get(self.person_id, _MISSING)
+        if birth_year is _MISSING:
+            birth_year = extract_birth_year(self.person_id, gedcom_ctx)
+            cache[self.person_id] = birth_year
 
         # Calculate the birth year distance heuristic (h_cost)
         if birth_year is not None and self.target_birth_year is not None:
@@ -94,41 +124,31 @@ class NodePriority:
         if self._birth_year_distance < BIRTH_YEAR_PROXIMITY_THRESHOLD:
             self._adjusted_distance += self._birth_year_distance / BIRTH_YEAR_HEURISTIC_FACTOR
 
-        # Calculate the birth year distance heuristic (h_cost)
-        if birth_year is not None and self.target_birth_year is not None:
-            self._birth_year_distance = abs(birth_year - self.target_birth_year)
-        elif birth_year is not None:
-            self._birth_year_distance = HAS_BIRTH_YEAR_BONUS
-        else:
-            self._birth_year_distance = NO_BIRTH_YEAR_PENALTY
-
-        # Calculate the adjusted total distance (f_cost = g_cost + h_cost)
-        # g_cost is self.distance.
-        self._adjusted_distance = float(self.distance)
-        if self._birth_year_distance < BIRTH_YEAR_PROXIMITY_THRESHOLD:
-            self._adjusted_distance += self._birth_year_distance / BIRTH_YEAR_HEURISTIC_FACTOR
+        self._key = (self._adjusted_distance, self._birth_year_distance, self.person_id)
 
     def __eq__(self, other):
         if not isinstance(other, NodePriority):
             return NotImplemented
         # Two nodes are equal if their sort keys are identical.
-        return (self._adjusted_distance, self._birth_year_distance, self.person_id) == \
-               (other._adjusted_distance, other._birth_year_distance, other.person_id)
+        # The f_cost alone settles almost every comparison, so test it first.
+        if self._adjusted_distance != other._adjusted_distance:
+            return False
+        return self._key == other._key
 
     def __lt__(self, other):
         """
         Compares two nodes for priority queue ordering.
-        The comparison is done via a tuple, which is efficient and readable.
+        The comparison is done via the precomputed key tuple, which heapq can compare in C.
         """
-        if not isinstance(other, NodePriority):
-            return NotImplemented
-
         # The sort order is determined by this tuple:
         # 1. Adjusted Distance (f_cost): The primary factor, combining real distance and heuristic.
         # 2. Birth Year Distance (h_cost): A secondary heuristic to guide the search.
         # 3. Person ID: A final, deterministic tie-breaker.
-        return (self._adjusted_distance, self._birth_year_distance, self.person_id) < \
-               (other._adjusted_distance, other._birth_year_distance, other.person_id)
+        if not isinstance(other, NodePriority):
+            return NotImplemented
+        if self._adjusted_distance != other._adjusted_distance:
+            return self._adjusted_distance < other._adjusted_distance
+        return self._key < other._key
 
     def __repr__(self):
         return (
@@ -5,12 +5,77 @@ genealogy-specific name formats commonly found in GEDCOM files.
 """
 
 import re
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import sys
+from typing import Optional, List, Dict, Any, Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from nameparser import HumanName
+from nameparser.config import CONSTANTS
 
+# Maximum number of distinct name strings kept by the parse cache
+NAME_CACHE_SIZE = 4096
 
-@dataclass
+# Full name strings are too varied for sys.intern; share equal ones through a
+# table that is simply dropped once it holds _DEDUP_MAX entries
+_DEDUP_MAX = 50000
+_dedup: Dict[str, str] = {}
+
+
+def _dedupe(value: str) -> str:
+    shared = _dedup.get(value)
+    if shared is not None:
+        return shared
+    if len(_dedup) >= _DEDUP_MAX:
+        _dedup.clear()
+    _dedup[value] = value
+    return value
+
+
+# Quoted nickname ('John "Jack" Smith') and GEDCOM surname ("John /Smith/")
+_NICKNAME_RE = re.compile(r'"([^"]+)"')
+_SURNAME_RE = re.compile(r'/([^/]+)/')
+
+
+def _cut_match(text: str, match: re.Match, delimiter: str) -> str:
+    """Remove every match of match.re from text, reusing the span of the first one.
+
+    Only the text after the first match is rescanned, and only if it still
+    contains the delimiter.
+    """
+    rest = text[match.end():]
+    if delimiter in rest:
+        rest = match.re.sub('', rest)
+    return text[:match.start()] + rest
+
+# Words nameparser may treat as a title or suffix. Given names made only of
+# letters that are neither these words nor roman numerals cannot yield a
+# title or suffix, so HumanName can be skipped for them.
+_TITLE_SUFFIX_WORDS = frozenset(
+    word.lower() for word in (*CONSTANTS.titles, *CONSTANTS.suffix_acronyms, *CONSTANTS.suffix_not_acronyms)
+)
+_ROMAN_NUMERAL_RE = CONSTANTS.regexes.roman_numeral
+
+
+def _may_have_title_or_suffix(words: List[str]) -> bool:
+    return any(
+        not word.isalpha() or word.lower() in _TITLE_SUFFIX_WORDS or _ROMAN_NUMERAL_RE.match(word)
+        for word in words
+    )
+
+
+# Surname prefixes ("van", "de la") and conjunctions join words in nameparser,
+# so plain names containing them still need HumanName to find the surname
+_JOINING_WORDS = frozenset(word.lower() for word in (*CONSTANTS.prefixes, *CONSTANTS.conjunctions))
+
+
+def _is_plain_name(words: List[str]) -> bool:
+    """Check whether words split as first, middle..., last without HumanName."""
+    return len(words) > 1 and not _may_have_title_or_suffix(words) and not any(
+        word.lower() in _JOINING_WORDS for word in words
+    )
+
+
+@dataclass(slots=True)
 class GenealogyName:
     """Represents a parsed genealogy name with all components."""
     original_text: str
@@ -48,6 +113,10 @@ class GenealogyName:
         }
 
 
+# Empty-input result read by parse_genealogy_names; never handed out to callers
+_EMPTY_NAME = GenealogyName(original_text="", given_names=[], surname="")
+
+
 def parse_genealogy_name(name_string: str) -> GenealogyName:
     """Parse a genealogy name string and return a GenealogyName object.
     
@@ -66,32 +135,39 @@ def parse_genealogy_name(name_string: str) -> GenealogyName:
         name_string: The name string to parse
         
     Returns:
-        GenealogyName object with parsed information
+        GenealogyName object with parsed information; callers own the result
     """
     if not name_string or not isinstance(name_string, str):
         return GenealogyName(original_text="", given_names=[], surname="")
     
-    original = name_string.strip()
+    # The cached instance is shared, so hand out a copy the caller may modify
+    cached = _parse_genealogy_name_cached(name_string.strip())
+    return replace(cached, given_names=list(cached.given_names))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_genealogy_name_cached(original: str) -> GenealogyName:
+    """Parse a stripped name string; results are memoized since names repeat across a tree."""
     name_string = original
     
     # Extract nickname (text in quotes)
     nickname = None
-    nickname_match = re.search(r'"([^"]+)"', name_string)
+    nickname_match = _NICKNAME_RE.search(name_string)
     if nickname_match:
         nickname = nickname_match.group(1)
         # Remove nickname from name string for further processing
-        name_string = re.sub(r'"[^"]+"', '', name_string).strip()
+        name_string = _cut_match(name_string, nickname_match, '"').strip()
     
     # Extract surname (text between //)
     surname = ""
-    surname_match = re.search(r'/([^/]+)/', name_string)
+    surname_match = _SURNAME_RE.search(name_string)
     if surname_match:
         surname = surname_match.group(1).strip()
     
     # Handle GEDCOM format names (surname in slashes)
     if surname:
         # Remove surname from name string for further processing
-        name_without_surname = re.sub(r'/[^/]+/', '', name_string).strip()
+        name_without_surname = _cut_match(name_string, surname_match, '/').strip()
         
         # For GEDCOM format, treat ALL words before the surname as given names
         # regardless of what nameparser thinks
@@ -100,16 +176,32 @@ def parse_genealogy_name(name_string: str) -> GenealogyName:
         else:
             given_names = []
             
-        # Extract title and suffix by parsing the name without the surname part
-        temp_parsed = HumanName(name_without_surname)
-        title = temp_parsed.title if temp_parsed.title else None
-        suffix = temp_parsed.suffix if temp_parsed.suffix else None
+        # Extract title and suffix by parsing the name without the surname part;
+        # plain given names (the common case) cannot contain either
+        title = None
+        suffix = None
+        if _may_have_title_or_suffix(given_names):
+            temp_parsed = HumanName(name_without_surname)
+            title = temp_parsed.title if temp_parsed.title else None
+            suffix = temp_parsed.suffix if temp_parsed.suffix else None
         
         # Remove title and suffix from given_names if they exist there
-        if title and title in given_names:
-            given_names.remove(title)
-        if suffix and suffix in given_names:
-            given_names.remove(suffix)
+        # (first occurrence only, in a single pass)
+        if title or suffix:
+            to_skip = [word for word in (title, suffix) if word]
+            kept = []
+            for word in given_names:
+                if word in to_skip:
+                    to_skip.remove(word)
+                else:
+                    kept.append(word)
+            given_names = kept
+    elif _is_plain_name(words := name_string.split()):
+        # "Given [Middle...] Surname" with no titles, suffixes or surname prefixes
+        title = None
+        suffix = None
+        surname = words[-1]
+        given_names = words[:-1]
     else:
         # Use nameparser for regular name parsing
         parsed = HumanName(name_string)
@@ -128,8 +220,14 @@ def parse_genealogy_name(name_string: str) -> GenealogyName:
         if middle:
             given_names.extend(middle.split())
     
+    # Surnames, titles and suffixes repeat heavily across a tree; share one copy each
+    surname = sys.intern(surname) if surname else surname
+    title = sys.intern(title) if title else title
+    suffix = sys.intern(suffix) if suffix else suffix
+    nickname = sys.intern(nickname) if nickname else nickname
+    
     return GenealogyName(
-        original_text=original,
+        original_text=_dedupe(original),
         given_names=given_names,
         surname=surname,
         prefix=title,  # Using title as prefix to match our existing convention
@@ -139,6 +237,44 @@ def parse_genealogy_name(name_string: str) -> GenealogyName:
     )
 
 
+def parse_genealogy_names(names: Sequence[str]) -> Dict[str, List[Optional[str]]]:
+    """Parse many names at once into parallel columns instead of GenealogyName objects.
+    
+    Args:
+        names: The name strings to parse
+        
+    Returns:
+        Dictionary of equally long lists keyed by "surname", "given_first",
+        "prefix", "suffix" and "nickname"; entry i describes names[i]
+    """
+    count = len(names)
+    surnames = [None] * count
+    given_first = [None] * count
+    prefixes = [None] * count
+    suffixes = [None] * count
+    nicknames = [None] * count
+    
+    for i, name_string in enumerate(names):
+        if not name_string or not isinstance(name_string, str):
+            parsed = _EMPTY_NAME
+        else:
+            # Read-only use, so the cached instance needs no copy
+            parsed = _parse_genealogy_name_cached(name_string.strip())
+        surnames[i] = parsed.surname
+        given_first[i] = parsed.given_names[0] if parsed.given_names else None
+        prefixes[i] = parsed.prefix
+        suffixes[i] = parsed.suffix
+        nicknames[i] = parsed.nickname
+    
+    return {
+        "surname": surnames,
+        "given_first": given_first,
+        "prefix": prefixes,
+        "suffix": suffixes,
+        "nickname": nicknames,
+    }
+
+
 def normalize_name(name_string: str) -> str:
     """Normalize a name for comparison purposes.
     
@@ -211,15 +347,12 @@ def find_name_variants(name_string: str) -> List[str]:
     if parsed.surname:
         variants.append(parsed.surname)
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_variants = []
+    # Remove case-insensitive duplicates while preserving order (first spelling wins)
+    unique_variants = {}
     for variant in variants:
-        if variant.lower() not in seen:
-            seen.add(variant.lower())
-            unique_variants.append(variant)
+        unique_variants.setdefault(variant.lower(), variant)
     
-    return unique_variants
+    return list(unique_variants.values())
 
 
 def format_gedcom_name(genealogy_name: GenealogyName) -> str:
@@ -4,16 +4,16 @@ This module provides enhanced place name normalization capabilities that handle
 genealogy-specific place formats.
 """
 
-import re
+import sys
 from typing import Optional, Dict, List, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedPlace:
     """Represents a normalized place name with geographic hierarchy."""
     original_text: str
-    normalized_name: str
     country: Optional[str] = None
     state_province: Optional[str] = None
     county: Optional[str] = None
@@ -21,33 +21,54 @@ class NormalizedPlace:
     department: Optional[str] = None  # French departments, etc.
     region: Optional[str] = None      # Administrative regions
     postal_code: Optional[str] = None # ZIP/postal codes
-    
-# Geographic hierarchy patterns for common formats
-# Format: regex pattern -> (components...)
-GEOGRAPHIC_PATTERNS = [
-    # Complex pattern: City, Postal Code, Department, Region, Country
-    # Example: "Nancy, 54000, Meurthe-et-Moselle, Grand-Est, France"
-    (r'^(.+?),\s*(\d{5}),\s*(.+?),\s*(.+?),\s*(.+?)$', ('city', 'postal_code', 'department', 'region', 'country')),
-    
-    # Pattern with Department/Region: City, Department, Region, Country
-    (r'^(.+?),\s*(.+?),\s*(.+?),\s*(.+?)$', ('city', 'department', 'region', 'country')),
-    
-    # Pattern with Postal Code: City, Postal Code, State/Province, Country
-    (r'^(.+?),\s*(\d{5}),\s*(.+?),\s*(.+?)$', ('city', 'postal_code', 'state_province', 'country')),
-    
-    # Traditional patterns (preserved for backward compatibility)
-    # City, County, State, Country
-    (r'^(.+?),\s*(.+?),\s*(.+?),\s*(.+?)$', ('city', 'county', 'state_province', 'country')),
-    
-    # City, State, Country
-    (r'^(.+?),\s*(.+?),\s*(.+?)$', ('city', 'state_province', 'country')),
-    
+
+    @property
+    def normalized_name(self) -> str:
+        """The normalized place name; normalization keeps the stripped original text."""
+        return self.original_text
+
+
+# Maximum number of distinct place strings kept by the normalization cache
+PLACE_CACHE_SIZE = 4096
+
+# Low-cardinality components that repeat across a tree and are worth interning
+_INTERNED_COMPONENTS = frozenset({'country', 'state_province', 'county', 'department', 'region'})
+
+
+# Bounded stand-in for sys.intern for high-cardinality strings (city, full text):
+# the table is dropped when full, so entries do not live for the whole process
+_DEDUP_MAX = 50000
+_dedup: Dict[str, str] = {}
+
+
+def _dedupe(value: str) -> str:
+    shared = _dedup.get(value)
+    if shared is not None:
+        return shared
+    if len(_dedup) >= _DEDUP_MAX:
+        _dedup.clear()
+    _dedup[value] = value
+    return value
+
+
+def _is_postal_code(part: str) -> bool:
+    """Check for a five-digit postal code such as the 54000 in 'Nancy, 54000, ...'."""
+    return len(part) == 5 and part.isdecimal()
+
+# Geographic hierarchy layouts for common formats, keyed by
+# (number of comma-separated parts, a postal code was found).
+# The last component takes any further parts, commas included.
+PLACE_LAYOUTS = {
     # City, Country
-    (r'^(.+?),\s*(.+?)$', ('city', 'country')),
-    
-    # State, Country (for places that are states/regions)
-    (r'^(.+?),\s*(.+?)$', ('state_province', 'country')),
-]
+    (2, False): ('city', 'country'),
+    # City, State, Country
+    (3, False): ('city', 'state_province', 'country'),
+    # City, Department, Region, Country
+    (4, False): ('city', 'department', 'region', 'country'),
+    # City, Postal Code, Department, Region, Country
+    # Example: "Nancy, 54000, Meurthe-et-Moselle, Grand-Est, France"
+    (5, True): ('city', 'postal_code', 'department', 'region', 'country'),
+}
 
 
 def normalize_place_name(place_string: str) -> NormalizedPlace:
@@ -57,91 +78,64 @@ def normalize_place_name(place_string: str) -> NormalizedPlace:
         place_string: The place string to normalize
         
     Returns:
-        NormalizedPlace object with parsed information
+        NormalizedPlace object with parsed information; callers own the result
     """
     if not place_string or not isinstance(place_string, str):
-        return NormalizedPlace(original_text="", normalized_name="")
+        return NormalizedPlace(original_text="")
     
-    original = place_string.strip()
-    normalized_name = original
-    
-    # Try to extract geographic hierarchy
-    city = None
-    county = None
-    state_province = None
-    country = None
-    department = None
-    region = None
-    postal_code = None
-    
-    # Apply geographic patterns
-    for pattern, components in GEOGRAPHIC_PATTERNS:
-        match = re.match(pattern, normalized_name)
-        if match:
-            # Map matched groups to components
-            values = match.groups()
-            if len(values) == len(components):
-                component_mapping = dict(zip(components, values))
-                
-                city = component_mapping.get('city', '').strip() if component_mapping.get('city') else None
-                county = component_mapping.get('county', '').strip() if component_mapping.get('county') else None
-                state_province = component_mapping.get('state_province', '').strip() if component_mapping.get('state_province') else None
-                country = component_mapping.get('country', '').strip() if component_mapping.get('country') else None
-                department = component_mapping.get('department', '').strip() if component_mapping.get('department') else None
-                region = component_mapping.get('region', '').strip() if component_mapping.get('region') else None
-                postal_code = component_mapping.get('postal_code', '').strip() if component_mapping.get('postal_code') else None
-                break
-    
-    # If we couldn't parse with patterns, try heuristic approach for complex names
-    if not city and not state_province and not country:
-        # Handle complex French-style addresses: "Nancy, 54000, Meurthe-et-Moselle, Grand-Est, France"
-        parts = [p.strip() for p in normalized_name.split(',') if p.strip()]
-        if parts:
-            # Check if second part looks like a postal code (5 digits)
-            if len(parts) >= 2 and re.match(r'^\d{5}$', parts[1]):
-                # Format: City, Postal Code, Department, Region, Country
-                if len(parts) >= 1:
-                    city = parts[0]
-                if len(parts) >= 2:
-                    postal_code = parts[1]
-                if len(parts) >= 3:
-                    department = parts[2]
-                if len(parts) >= 4:
-                    region = parts[3]
-                if len(parts) >= 5:
-                    country = parts[4]
-            elif len(parts) >= 4:
-                # Format: City, Department, Region, Country
-                city = parts[0]
-                department = parts[1]
-                region = parts[2]
-                country = parts[3]
-            else:
-                # Fall back to simple hierarchical approach
-                # Last part is usually country, second to last is state/province, etc.
-                if len(parts) >= 1:
-                    country = parts[-1]
-                if len(parts) >= 2:
-                    state_province = parts[-2]
-                if len(parts) >= 3:
-                    county = parts[-3]
-                if len(parts) >= 4:
-                    city = parts[-4]
-                elif len(parts) == 1:
-                    # If only one part, treat as city
-                    city = parts[0]
+    # The cached instance is shared, so hand out a copy the caller may modify
+    return replace(_normalize_place_name_cached(place_string.strip()))
+
+
+@lru_cache(maxsize=PLACE_CACHE_SIZE)
+def _normalize_place_name_cached(original: str) -> NormalizedPlace:
+    """Normalize a stripped place string; results are memoized since places repeat across a tree."""
+    original = _dedupe(original)
+    
+    if ',' not in original:
+        # A single name (very common: "Boston", "Germany") is treated as both city and country
+        place = sys.intern(original) if original else None
+        return NormalizedPlace(original_text=original, city=place, country=place)
+    
+    # Pick the layout from the comma count, then split just once
+    part_count = original.count(',') + 1
+    raw_parts = original.split(',')
+    components = PLACE_LAYOUTS[(min(part_count, 4), False)]
+    # The postal code may follow a street address spanning several parts, so take the
+    # first one that still leaves department, region and country after it
+    for i in range(1, part_count - 3):
+        if _is_postal_code(raw_parts[i].strip()):
+            # Everything before the postal code is the city, commas included
+            raw_parts[:i] = [','.join(raw_parts[:i])]
+            components = PLACE_LAYOUTS[(5, True)]
+            break
+    if len(raw_parts) > len(components):
+        # The last component takes the remaining parts, commas included
+        raw_parts[len(components) - 1:] = [','.join(raw_parts[len(components) - 1:])]
+    # Jurisdictions are positional, so an empty part means that level is unknown
+    values = [p.strip() or None for p in raw_parts]
+    fields = {
+        component: (sys.intern(value) if component in _INTERNED_COMPONENTS else _dedupe(value)) if value else value
+        for component, value in zip(components, values)
+    }
+    return NormalizedPlace(original_text=original, **fields)
+
+
+def normalize_place_names(place_strings: List[str]) -> List[NormalizedPlace]:
+    """Normalize many place strings at once, normalizing each distinct string only once.
     
-    return NormalizedPlace(
-        original_text=original,
-        normalized_name=normalized_name,
-        country=country,
-        state_province=state_province,
-        county=county,
-        city=city,
-        department=department,
-        region=region,
-        postal_code=postal_code
-    )
+    Args:
+        place_strings: The place strings to normalize
+        
+    Returns:
+        NormalizedPlace objects in the same order as the input; repeated strings
+        share the same object
+    """
+    unique = {}
+    for place_string in place_strings:
+        if place_string not in unique:
+            unique[place_string] = normalize_place_name(place_string)
+    return [unique[place_string] for place_string in place_strings]
 
 
 def extract_geographic_hierarchy(place_string: str) -> Dict[str, str]:
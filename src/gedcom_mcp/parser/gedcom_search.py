@@ -2,19 +2,107 @@
 
 import heapq
 import time
+from collections import deque
+from functools import lru_cache
 import logging
-import collections
 import json
 import traceback
-from typing import List, Set, Dict, Any, Tuple, Optional
+from typing import List, Set, FrozenSet, Dict, Any, Tuple, Optional
 
-from .gedcom_models import NodePriority
-from .gedcom_utils import extract_birth_year
 from .gedcom_data_access import get_person_record, _get_person_relationships_internal
 
+# Distance of a node that has not been reached yet
+INF = float('inf')
+
+# One bit per relationship type, so a set of allowed relationships is cached and tested as one int
+REL_PARENT, REL_MOTHER, REL_FATHER, REL_CHILD, REL_SPOUSE, REL_SIBLING = 1, 2, 4, 8, 16, 32
+REL_BITS = {
+    "parent": REL_PARENT,
+    "mother": REL_MOTHER,
+    "father": REL_FATHER,
+    "child": REL_CHILD,
+    "spouse": REL_SPOUSE,
+    "sibling": REL_SIBLING,
+}
+
+
+_PARENT_BITS = REL_PARENT | REL_MOTHER | REL_FATHER
+
+
+def _parent_relationship_type(parent_bits: int, gender: Optional[str]) -> Optional[str]:
+    if parent_bits & REL_PARENT:
+        return "parent"
+    if parent_bits & REL_MOTHER and gender == "F":
+        return "mother"
+    if parent_bits & REL_FATHER and gender == "M":
+        return "father"
+    return None
+
+
+# Edge type for a parent by (parent/mother/father bits, parent's gender); None leaves the parent out.
+# Genders other than "M" and "F" use the None entry.
+PARENT_DECISION: Dict[Tuple[int, Optional[str]], Optional[str]] = {
+    (parent_bits, gender): _parent_relationship_type(parent_bits, gender)
+    for parent_bits in range(_PARENT_BITS + 1)
+    for gender in ("M", "F", None)
+}
+
+
+# Whole-string presets for the allowed_relationships argument
+_ALLOWED_PRESETS: Dict[str, frozenset] = {
+    "all": frozenset({"parent", "spouse", "sibling", "child"}),
+    "default": frozenset({"parent", "spouse", "child"}),  # Default: spouse, parents, children
+    "blood": frozenset({"parent", "child"}),  # Blood relationships only
+    "parents": frozenset({"parent"}),  # Parents only (both mother and father)
+    "children": frozenset({"child"}),  # Children only
+}
+
+# Relationships each entry of a comma-separated allowed_relationships list expands to
+_TOKEN_MAP: Dict[str, Tuple[str, ...]] = {
+    "spouse": ("spouse",),
+    "mother": ("mother",),  # Handled specially in the neighbor function
+    "father": ("father",),  # Handled specially in the neighbor function
+    "parents": ("parent",),  # Both mother and father
+    "children": ("child",),
+    "blood": ("parent", "child"),
+    "sibling": ("sibling",),
+    "parent": ("parent",),
+    "child": ("child",),
+    "all": ("parent", "spouse", "sibling", "child"),
+}
+
+ALLOWED_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=ALLOWED_CACHE_SIZE)
+def _parse_allowed(allowed_relationships: str) -> frozenset:
+    """Parse an allowed_relationships argument into relationship names; memoized since callers repeat a few strings.
+    Unknown entries are logged and ignored."""
+    preset = _ALLOWED_PRESETS.get(allowed_relationships.lower())
+    if preset is not None:
+        return preset
+    
+    allowed = set()
+    for rel in dict.fromkeys(rel.strip().lower() for rel in allowed_relationships.split(",")):
+        expansion = _TOKEN_MAP.get(rel)
+        if expansion is None:
+            logging.getLogger(__name__).warning(f"Unknown relationship type: {rel}")
+        else:
+            allowed.update(expansion)
+    return frozenset(allowed)
+
+
+def _relationship_mask(allowed_relationships: Set[str]) -> int:
+    """Encode allowed relationship names as REL_BITS flags; unknown names add no edges, so they are ignored"""
+    mask = 0
+    for relationship in allowed_relationships:
+        mask |= REL_BITS.get(relationship, 0)
+    return mask
+
+
 def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str], gedcom_ctx, max_distance=100, exclude_initial_spouse_children=False, min_distance=0, strict_min_distance=False):
-    """Optimized bidirectional Dijkstra search with better data structures and pruning"""
-    import time
+    """Bidirectional breadth-first search over single-hop relationships, with pruning.
+    Kept under its Dijkstra name since callers import it; on unit weights BFS settles nodes in the same order."""
     
     if not gedcom_ctx.gedcom_parser:
         return None, -1
@@ -27,30 +115,21 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
     # But don't go beyond a reasonable limit to prevent infinite searches
     effective_max_distance = min(max_distance, 100)
     
-    # OPTIMIZATION 2: Component connectivity check for disconnected pairs
-    # First do a very quick check with small max_depth
-    connectivity_start = time.time()
-    connectivity_result = check_component_connectivity(start, end, allowed_relationships, gedcom_ctx, max_depth=50)
-    connectivity_time = time.time() - connectivity_start
-    
-    if connectivity_result is False:
-        # We'll need to import logger when this function is used
-        # logger.info(f"PERF: Quick connectivity check - people are in different components (took {connectivity_time:.3f}s)")
-        return None, -1
-    elif connectivity_result is True:
-        # We'll need to import logger when this function is used
-        # logger.info(f"PERF: Quick connectivity check - found direct connection (took {connectivity_time:.3f}s)")
-        pass
-    else:
-        # We'll need to import logger when this function is used
-        # logger.info(f"PERF: Quick connectivity check inconclusive - proceeding with full search (took {connectivity_time:.3f}s)")
-        pass
-    
     # Keep track of original start and end for path reconstruction
     original_start, original_end = start, end
     
-    # OPTIMIZATION: Pre-compute the relationships cache key to avoid repeated tuple(sorted()) calls
-    relationships_cache_key = tuple(sorted(allowed_relationships))
+    # OPTIMIZATION: Pre-compute the relationships cache key (a REL_BITS mask) once per search
+    relationships_cache_key = _relationship_mask(allowed_relationships)
+    # Family relationships are symmetric, so both directions read the same adjacency
+    adjacency = _get_adjacency(allowed_relationships, gedcom_ctx, relationships_cache_key)
+    
+    # OPTIMIZATION 2: People in different connected components cannot be related.
+    # Components are labelled once per tree, so this is two lookups per query.
+    component_of = _get_components(allowed_relationships, gedcom_ctx, relationships_cache_key)
+    if component_of.get(start) != component_of.get(end):
+        # We'll need to import logger when this function is used
+        # logger.info(f"PERF: Component check - people are in different components")
+        return None, -1
     
     # Verify both people exist and have some connections
     start_neighbors = _get_person_neighbors_lazy(start, allowed_relationships, gedcom_ctx, exclude_spouse_children=exclude_initial_spouse_children, relationships_cache_key=relationships_cache_key)
@@ -69,27 +148,21 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
         start_neighbors, end_neighbors = end_neighbors, start_neighbors
         swapped = True
     
-    # Get target birth years for heuristic ordering
-    target_birth_year = extract_birth_year(end, gedcom_ctx)
-    start_birth_year = extract_birth_year(start, gedcom_ctx)
-    
-    # Forward search (from start) - using deterministic NodePriority
-    class InfinityDict(dict):
-        def __missing__(self, key):
-            return float('infinity')
-    
-    forward_distances = InfinityDict()
-    forward_distances[start] = 0
-    forward_previous = {}
-    forward_visited = set()
-    forward_pq = [NodePriority(0, start, [start], target_birth_year)]
-    
-    # Backward search (from end) - using deterministic NodePriority  
-    backward_distances = InfinityDict()
-    backward_distances[end] = 0
-    backward_previous = {}
-    backward_visited = set()
-    backward_pq = [NodePriority(0, end, [end], start_birth_year)]
+    # Every relationship is a single hop, so plain FIFO queues settle nodes in distance order
+    # and no priority queue is needed: the search is a bidirectional BFS.
+    # Reached nodes map to (distance, previous node, relationship type);
+    # one probe answers both "reached?" and "how far?"
+    forward_reached = {start: (0, None, None)}
+    forward_queue = deque([start])
+    
+    backward_reached = {end: (0, None, None)}
+    backward_queue = deque([end])
+    
+    # Both directions run the same step; each side is (queue, reached, other side's reached,
+    # initial node)
+    forward_side = (forward_queue, forward_reached, backward_reached, start)
+    backward_side = (backward_queue, backward_reached, forward_reached, end)
+    
     nodes_processed = 0
     edges_examined = 0
     search_start = time.time()
@@ -99,186 +172,93 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
     time_limit = 120.0  # 120 seconds max for distant relationships
     
     # Best meeting point found so far
-    best_distance = float('infinity')
+    best_distance = INF
     meeting_node = None
     
     # Track shortest path as fallback if no path meets min_distance
-    shortest_distance = float('infinity')
+    shortest_distance = INF
     shortest_meeting_node = None
     
-    while forward_pq or backward_pq:
-        # Check if both searches have exceeded reasonable distance
-        min_forward_dist = forward_pq[0].distance if forward_pq else float('infinity')
-        min_backward_dist = backward_pq[0].distance if backward_pq else float('infinity')
+    while forward_queue or backward_queue:
+        # Each queue holds at most two consecutive distances, smallest at the front
+        min_forward_dist = forward_reached[forward_queue[0]][0] if forward_queue else INF
+        min_backward_dist = backward_reached[backward_queue[0]][0] if backward_queue else INF
         
-        # Only stop if BOTH queues have real distances that exceed the limit
-        # Don't stop if one queue is empty (infinity) unless both are empty
-        # For distant relationships, be more lenient with the distance check
-        if (forward_pq and backward_pq and 
-            min_forward_dist + min_backward_dist > effective_max_distance * 1.2):  # Allow 20% overage for distant relationships
+        # EARLY TERMINATION: If one side has exhausted all reachable nodes without finding target
+        # This is crucial for disconnected components
+        if not forward_queue and best_distance == INF:
             # We'll need to import logger when this function is used
-            # logger.info(f"PERF: Bidirectional: Stopping search - combined distance {min_forward_dist + min_backward_dist:.1f} exceeds max {effective_max_distance}")
+            # logger.info(f"PERF: Bidirectional: Forward search exhausted all reachable nodes ({len(forward_reached)} nodes) - no connection exists")
             break
-        
-        # Stop if both queues are empty (no more nodes to explore)
-        if not forward_pq and not backward_pq:
+        if not backward_queue and best_distance == INF:
             # We'll need to import logger when this function is used
-            # logger.info(f"PERF: Bidirectional: No more nodes to explore")
+            # logger.info(f"PERF: Bidirectional: Backward search exhausted all reachable nodes ({len(backward_reached)} nodes) - no connection exists")
             break
         
-        # EARLY TERMINATION: If one side has exhausted all reachable nodes without finding target
-        # This is crucial for disconnected components
-        if not forward_pq and best_distance == float('infinity'):
+        # Stop once no unsettled pair of nodes can beat the best meeting found so far (mu).
+        # An exhausted side settles nothing new, so it contributes 0 to the bound.
+        # The first meeting is not enough: it can lie on a longer path than one found later.
+        if (min_forward_dist if forward_queue else 0) + (min_backward_dist if backward_queue else 0) >= best_distance:
             # We'll need to import logger when this function is used
-            # logger.info(f"PERF: Bidirectional: Forward search exhausted all reachable nodes ({len(forward_visited)} nodes) - no connection exists")
+            # logger.info(f"PERF: Bidirectional: Stopping search - current paths ({min_forward_dist + min_backward_dist:.1f}) >= best path ({best_distance})")
             break
-        if not backward_pq and best_distance == float('infinity'):
+        
+        # A path not met yet is longer than both frontier depths together (exhausted sides
+        # again count 0), so once they add up to max_distance nothing within range is left.
+        # This bounds the total rather than each side, which may run ahead of the other.
+        if (min_forward_dist if forward_queue else 0) + (min_backward_dist if backward_queue else 0) >= effective_max_distance:
             # We'll need to import logger when this function is used
-            # logger.info(f"PERF: Bidirectional: Backward search exhausted all reachable nodes ({len(backward_visited)} nodes) - no connection exists")
+            # logger.info(f"PERF: Bidirectional: Frontiers reached max distance {effective_max_distance}")
             break
         
-        # OPTIMIZATION: Stop if current search paths are longer than best known complete path
-        if best_distance != float('infinity'):
-            if min_forward_dist + min_backward_dist >= best_distance:
-                # We'll need to import logger when this function is used
-                # logger.info(f"PERF: Bidirectional: Stopping search - current paths ({min_forward_dist + min_backward_dist:.1f}) >= best path ({best_distance})")
-                break
+        # Advance whichever side has the smaller frontier; the stopping rule holds for any alternation
+        if forward_queue and (not backward_queue or len(forward_queue) <= len(backward_queue)):
+            queue, side_reached, other_reached, origin = forward_side
+        else:
+            queue, side_reached, other_reached, origin = backward_side
         
-        # Alternate between forward and backward search - ensure balanced exploration
-        # Use simple alternation based on which side has processed fewer nodes
-        if forward_pq and (not backward_pq or len(forward_visited) <= len(backward_visited)):
-            # Forward step
-            current_priority = heapq.heappop(forward_pq)
-            current_distance, current_node = current_priority.distance, current_priority.person_id
-            
-            # Skip if already visited (better path already found)
-            if current_node in forward_visited:
-                continue
-            
-            # Skip if we've already found a better path to this node
-            if current_distance > forward_distances[current_node]:
-                continue
-                
-            forward_visited.add(current_node)
-            nodes_processed += 1
-            
-            # Check if we've met the backward search
-            if current_node in backward_visited:
-                total_distance = forward_distances[current_node] + backward_distances[current_node]
-                
-                # Always track the shortest path as fallback
-                if total_distance < shortest_distance:
-                    shortest_distance = total_distance
-                    shortest_meeting_node = current_node
-                
-                # Check if this path meets our minimum distance requirement
-                if total_distance >= min_distance and total_distance < best_distance:
-                    # Accept the meeting point - trust Dijkstra won't create cycles
-                    best_distance = total_distance
-                    meeting_node = current_node
-                    # We'll need to import logger when this function is used
-                    # logger.info(f"PERF: Bidirectional: Found valid meeting point {current_node} with distance {best_distance} (meets min_distance {min_distance})")
-                    break
-                elif min_distance == 0 and total_distance < best_distance:
-                    # If no minimum distance required, accept any shortest path
-                    best_distance = total_distance
-                    meeting_node = current_node
-                    # We'll need to import logger when this function is used
-                    # logger.info(f"PERF: Bidirectional: Found meeting point {current_node} with distance {best_distance} - pruning optimization now active")
-                    break
-            
-            # Stop if we've exceeded half the max distance (since we're searching from both ends)
-            if current_distance >= effective_max_distance // 2:
-                continue  # Skip expanding this node
-            
-            # OPTIMIZATION: Skip if this path is already longer than best known complete path
-            if best_distance != float('infinity') and current_distance >= best_distance:
-                # We'll need to import logger when this function is used
-                # logger.info(f"PERF: Bidirectional: Skipping forward node {current_node} (distance {current_distance}) >= best path ({best_distance})")
-                continue  # Skip expanding this node
-            
-            # Expand forward
-            # Only exclude spouse/children for the initial start node
-            exclude_for_this_node = exclude_initial_spouse_children and current_node == start
-            neighbors = _get_person_neighbors_lazy(current_node, allowed_relationships, gedcom_ctx, exclude_spouse_children=exclude_for_this_node, relationships_cache_key=relationships_cache_key)
-            for neighbor, weight, relationship_type in neighbors:
-                edges_examined += 1
-                if neighbor in forward_visited:
-                    continue
-                
-                distance = current_distance + weight
-                if distance < forward_distances[neighbor]:
-                    forward_distances[neighbor] = distance
-                    forward_previous[neighbor] = (current_node, relationship_type)
-                    new_path = current_priority.path + [neighbor]
-                    heapq.heappush(forward_pq, NodePriority(distance, neighbor, new_path, target_birth_year))
+        current_node = queue.popleft()
+        current_distance = side_reached[current_node][0]
         
-        elif backward_pq:
-            # Backward step
-            current_priority = heapq.heappop(backward_pq)
-            current_distance, current_node = current_priority.distance, current_priority.person_id
-            
-            # Skip if already visited (better path already found)
-            if current_node in backward_visited:
-                continue
-            
-            # Skip if we've already found a better path to this node
-            if current_distance > backward_distances[current_node]:
+        nodes_processed += 1
+        
+        # OPTIMIZATION: Skip if this path is already longer than best known complete path
+        if best_distance != INF and current_distance >= best_distance:
+            # We'll need to import logger when this function is used
+            # logger.info(f"PERF: Bidirectional: Skipping node {current_node} (distance {current_distance}) >= best path ({best_distance})")
+            continue  # Skip expanding this node
+        
+        # Expand this side
+        # Only exclude spouse/children for the side's initial node. Family relationships are
+        # bidirectional at the edge level, so the backward side walks the same neighbors;
+        # _correct_relationship_direction restores direction when the chain is described.
+        if exclude_initial_spouse_children and current_node == origin:
+            neighbors = _get_person_neighbors_lazy(current_node, allowed_relationships, gedcom_ctx, exclude_spouse_children=True, relationships_cache_key=relationships_cache_key)
+        else:
+            neighbors = adjacency.get(current_node, ())
+        for neighbor, weight, relationship_type in neighbors:
+            edges_examined += 1
+            # Breadth-first order reaches every node first along a shortest path
+            if neighbor in side_reached:
                 continue
-                
-            backward_visited.add(current_node)
-            nodes_processed += 1
+            distance = current_distance + weight
+            side_reached[neighbor] = (distance, current_node, relationship_type)
+            queue.append(neighbor)
             
-            # Check if we've met the forward search
-            if current_node in forward_visited:
-                total_distance = forward_distances[current_node] + backward_distances[current_node]
+            # Reached from both sides: a candidate path through this neighbor
+            other_side = other_reached.get(neighbor)
+            if other_side is not None and distance + other_side[0] <= effective_max_distance:
+                total_distance = distance + other_side[0]
                 
                 # Always track the shortest path as fallback
                 if total_distance < shortest_distance:
                     shortest_distance = total_distance
-                    shortest_meeting_node = current_node
+                    shortest_meeting_node = neighbor
                 
-                # Check if this path meets our minimum distance requirement
+                # Only paths meeting the minimum distance requirement count towards mu
                 if total_distance >= min_distance and total_distance < best_distance:
-                    # Accept the meeting point - trust Dijkstra won't create cycles
-                    best_distance = total_distance
-                    meeting_node = current_node
-                    # We'll need to import logger when this function is used
-                    # logger.info(f"PERF: Bidirectional: Found valid meeting point {current_node} with distance {best_distance} (meets min_distance {min_distance})")
-                    break
-                elif min_distance == 0 and total_distance < best_distance:
-                    # If no minimum distance required, accept any shortest path
                     best_distance = total_distance
-                    meeting_node = current_node
-                    # We'll need to import logger when this function is used
-                    # logger.info(f"PERF: Bidirectional: Found meeting point {current_node} with distance {best_distance}")
-                    break
-            
-            # Stop if we've exceeded half the max distance (since we're searching from both ends)
-            if current_distance >= effective_max_distance // 2:
-                continue  # Skip expanding this node
-            
-            # OPTIMIZATION: Skip if this path is already longer than best known complete path
-            if best_distance != float('infinity') and current_distance >= best_distance:
-                # We'll need to import logger when this function is used
-                # logger.info(f"PERF: Bidirectional: Skipping backward node {current_node} (distance {current_distance}) >= best path ({best_distance})")
-                continue  # Skip expanding this node
-            
-            # Expand backward (reverse relationships)
-            # Only exclude spouse/children for the initial end node
-            exclude_for_this_node = exclude_initial_spouse_children and current_node == end
-            neighbors = _get_person_neighbors_lazy_reverse(current_node, allowed_relationships, gedcom_ctx, exclude_spouse_children=exclude_for_this_node, relationships_cache_key=relationships_cache_key)
-            for neighbor, weight, relationship_type in neighbors:
-                edges_examined += 1
-                if neighbor in backward_visited:
-                    continue
-                
-                distance = current_distance + weight
-                if distance < backward_distances[neighbor]:
-                    backward_distances[neighbor] = distance
-                    backward_previous[neighbor] = (current_node, relationship_type)
-                    new_path = current_priority.path + [neighbor]
-                    heapq.heappush(backward_pq, NodePriority(distance, neighbor, new_path, start_birth_year))
+                    meeting_node = neighbor
         
         # Progress logging with queue status
         current_time = time.time()
@@ -287,8 +267,8 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
             rate = nodes_processed / elapsed if elapsed > 0 else 0
             # We'll need to import logger when this function is used
             # logger.info(f"PERF: Bidirectional search processed {nodes_processed} nodes, examined {edges_examined} edges - {rate:.1f} nodes/sec")
-            # logger.info(f"PERF: Queue status - Forward: {len(forward_pq)} items, Backward: {len(backward_pq)} items")
-            # logger.info(f"PERF: Visited - Forward: {len(forward_visited)} nodes, Backward: {len(backward_visited)} nodes")
+            # logger.info(f"PERF: Queue status - Forward: {len(forward_queue)} items, Backward: {len(backward_queue)} items")
+            # logger.info(f"PERF: Reached - Forward: {len(forward_reached)} nodes, Backward: {len(backward_reached)} nodes")
             last_log_time = current_time
             
             # TIME LIMIT: Stop if taking too long (likely disconnected)
@@ -323,22 +303,15 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
     current = meeting_node
     while current is not None:
         forward_path.append(current)
-        if current in forward_previous:
-            current, _ = forward_previous[current]
-        else:
-            current = None
+        current = forward_reached[current][1]
     forward_path.reverse()  # Now: [start, ..., meeting_node]
     
     # Backward path: from end to meeting_node  
     backward_path = []
-    current = meeting_node
+    current = backward_reached[meeting_node][1]
     while current is not None:
-        if current in backward_previous:
-            current, _ = backward_previous[current]
-            if current is not None:
-                backward_path.append(current)
-        else:
-            current = None
+        backward_path.append(current)
+        current = backward_reached[current][1]
     # backward_path is now: [node_before_meeting, ..., end]
     # We want: [meeting_node, ..., end] but excluding meeting_node since it's in forward_path
     
@@ -363,7 +336,8 @@ def _dijkstra_bidirectional_search(start, end, allowed_relationships: Set[str],
 
 def check_component_connectivity(person1_id, person2_id, allowed_relationships: Set[str], gedcom_ctx, max_depth=1000):
     """
-    Quick BFS-based connectivity checker to identify disconnected components before expensive search.
+    Quick DFS-based connectivity checker to identify disconnected components before expensive search.
+    Only reachability matters, so a plain list stack replaces a BFS queue.
     Returns True if connected, False if disconnected, None if inconclusive (hit max_depth).
     """
     
@@ -372,14 +346,17 @@ def check_component_connectivity(person1_id, person2_id, allowed_relationships:
         return True
     
     visited = set()
-    queue = collections.deque([person1_id])
+    stack = [person1_id]
     visited.add(person1_id)
     nodes_visited = 0
     
+    # Neighbor lists are built once per tree and set of allowed relationships
+    adjacency = _get_adjacency(allowed_relationships, gedcom_ctx)
+    
     search_start = time.time()
     
-    while queue and nodes_visited < max_depth:
-        current = queue.popleft()
+    while stack and nodes_visited < max_depth:
+        current = stack.pop()
         nodes_visited += 1
         
         # Early termination - found target
@@ -389,11 +366,14 @@ def check_component_connectivity(person1_id, person2_id, allowed_relationships:
             return True
             
         # Explore neighbors
-        neighbors = _get_person_neighbors_lazy(current, allowed_relationships, gedcom_ctx)
+        neighbors = adjacency.get(current, ())
         for neighbor_id, weight, rel_type in neighbors:
+            # Found the target as a neighbor - no need to wait until it is popped
+            if neighbor_id == person2_id:
+                return True
             if neighbor_id not in visited:
                 visited.add(neighbor_id)
-                queue.append(neighbor_id)
+                stack.append(neighbor_id)
                 
     # Check if we can reach person2 from our explored component
     is_connected = person2_id in visited
@@ -417,81 +397,137 @@ def _get_person_neighbors_lazy(person_id, allowed_relationships: Set[str], gedco
     Lazily gets neighbors (parents, spouses, children) of a person.
     This function is optimized for graph traversal algorithms like A*
     by only fetching necessary relationship data using _get_person_relationships_internal.
+    Returns a tuple of (neighbor_id, weight, relationship_type), shared through the cache.
     """
     if not gedcom_ctx.gedcom_parser:
-        return []
+        return ()
 
     # Use a combined cache for neighbors based on person_id and allowed_relationships
     # This prevents re-calculating neighbors for the same person and relationship type
     if relationships_cache_key is None:
-        relationships_cache_key = tuple(sorted(allowed_relationships))
+        relationships_cache_key = _relationship_mask(allowed_relationships)
     cache_key = (person_id, relationships_cache_key, exclude_spouse_children)
     
     if cache_key in gedcom_ctx.neighbor_cache:
         return gedcom_ctx.neighbor_cache[cache_key]
 
+    neighbors = _compute_person_neighbors(person_id, relationships_cache_key, gedcom_ctx, exclude_spouse_children)
+    
+    # Cache the result
+    gedcom_ctx.neighbor_cache[cache_key] = neighbors
+    return neighbors
+
+
+def _compute_person_neighbors(person_id, relationship_mask: int, gedcom_ctx, exclude_spouse_children=False):
+    """Build the (neighbor_id, weight, relationship_type) tuple of a person, without caching.
+    relationship_mask holds the REL_BITS flags of the allowed relationships."""
     neighbors = []
     
     # PERFORMANCE OPTIMIZATION: Use the new _get_person_relationships_internal
     person_relationships = _get_person_relationships_internal(person_id, gedcom_ctx)
     
     if not person_relationships:
-        gedcom_ctx.neighbor_cache[cache_key] = []
-        return []
+        return ()
     
     # Handle parent relationships (including mother/father specific)
-    if "parent" in allowed_relationships or "mother" in allowed_relationships or "father" in allowed_relationships:
+    parent_bits = relationship_mask & _PARENT_BITS
+    if parent_bits:
+        other_gender_type = PARENT_DECISION[(parent_bits, None)]
         for parent_id in person_relationships.parents:  # Already sorted during creation
             parent_relationships = _get_person_relationships_internal(parent_id, gedcom_ctx)
             if parent_relationships:
-                # Check if we should include this parent based on gender restrictions
-                include_parent = False
-                relationship_type = "parent"
-                
-                if "parent" in allowed_relationships:
-                    include_parent = True
-                elif "mother" in allowed_relationships and parent_relationships.gender == "F":
-                    include_parent = True
-                    relationship_type = "mother"
-                elif "father" in allowed_relationships and parent_relationships.gender == "M":
-                    include_parent = True
-                    relationship_type = "father"
-                
-                if include_parent:
+                # Gender restrictions are resolved by the precomputed decision table
+                relationship_type = PARENT_DECISION.get((parent_bits, parent_relationships.gender), other_gender_type)
+                if relationship_type is not None:
                     neighbors.append((parent_id, 1, relationship_type))
     
     # Handle child relationships
-    if "child" in allowed_relationships and not exclude_spouse_children:
-        neighbors.extend([(child_id, 1, "child") for child_id in person_relationships.children])  # Already sorted during creation
+    if relationship_mask & REL_CHILD and not exclude_spouse_children:
+        neighbors.extend((child_id, 1, "child") for child_id in person_relationships.children)  # Already sorted during creation
     
     # Add spouse relationships (exclude if requested)
-    if "spouse" in allowed_relationships and not exclude_spouse_children:
-        neighbors.extend([(spouse_id, 1, "spouse") for spouse_id in person_relationships.spouses])  # Already sorted during creation
+    if relationship_mask & REL_SPOUSE and not exclude_spouse_children:
+        neighbors.extend((spouse_id, 1, "spouse") for spouse_id in person_relationships.spouses)  # Already sorted during creation
     
     # Add sibling relationships (optimized)
-    if "sibling" in allowed_relationships:
-        siblings = set()
-        for parent_id in person_relationships.parents:
-            # Use cached parent relationships if available
-            parent_relationships = _get_person_relationships_internal(parent_id, gedcom_ctx)
-            
-            if parent_relationships:
-                # OPTIMIZATION: Use set operations for efficiency
-                parent_children = set(parent_relationships.children) - {person_id}
-                siblings.update(parent_children)
-        
-        # DETERMINISM FIX: Sort siblings to ensure consistent ordering between process runs
-        neighbors.extend([(sibling_id, 1, "sibling") for sibling_id in sorted(siblings)])
+    if relationship_mask & REL_SIBLING:
+        neighbors.extend((sibling_id, 1, "sibling") for sibling_id in _get_siblings(person_id, person_relationships, gedcom_ctx))
     
-    # Cache the result
-    gedcom_ctx.neighbor_cache[cache_key] = neighbors
-    return neighbors
+    # Cached and shared between searches, so hand out an immutable tuple
+    return tuple(neighbors)
+
+
+def _get_siblings(person_id, person_relationships, gedcom_ctx):
+    """Get the sorted sibling IDs of a person, memoized since every sibling shares the same parents"""
+    siblings = gedcom_ctx.sibling_cache.get(person_id)
+    if siblings is None:
+        # Use cached parent relationships if available
+        parent_relationships = [_get_person_relationships_internal(parent_id, gedcom_ctx)
+                                for parent_id in person_relationships.parents]
+        
+        # DETERMINISM FIX: Children are stored sorted, so merging them keeps a consistent
+        # order between process runs; children shared by both parents arrive adjacent
+        sibling_list = []
+        last = None
+        for sibling_id in heapq.merge(*(r.children for r in parent_relationships if r)):
+            if sibling_id != last and sibling_id != person_id:
+                sibling_list.append(sibling_id)
+            last = sibling_id
+        siblings = tuple(sibling_list)
+        gedcom_ctx.sibling_cache[person_id] = siblings
+    return siblings
+
+
+def _get_adjacency(allowed_relationships: Set[str], gedcom_ctx, relationships_cache_key=None):
+    """
+    Get the neighbor lists of every person in the tree, built once per set of allowed relationships.
+    Searches index this map directly instead of making a cached call per expanded node.
+    """
+    if relationships_cache_key is None:
+        relationships_cache_key = _relationship_mask(allowed_relationships)
+    
+    adjacency = gedcom_ctx.adjacency_cache.get(relationships_cache_key)
+    if adjacency is None:
+        # Built without going through neighbor_cache, which would only evict its hot entries
+        adjacency = {
+            person_id: _compute_person_neighbors(person_id, relationships_cache_key, gedcom_ctx)
+            for person_id in gedcom_ctx.individual_lookup
+        }
+        gedcom_ctx.adjacency_cache[relationships_cache_key] = adjacency
+    return adjacency
 
 
-def _get_person_neighbors_lazy_reverse(person_id, allowed_relationships: Set[str], gedcom_ctx, exclude_spouse_children=False, relationships_cache_key=None):
-    """Get reverse neighbors (for backward search)"""
-    # For family relationships, most are bidirectional, so we can reuse the same function
-    return _get_person_neighbors_lazy(person_id, allowed_relationships, gedcom_ctx, exclude_spouse_children=exclude_spouse_children, relationships_cache_key=relationships_cache_key)
+def _get_components(allowed_relationships: Set[str], gedcom_ctx, relationships_cache_key=None):
+    """
+    Map every person to a representative of their connected component, built once per set of allowed relationships.
+    Edges are treated as undirected, so two people with different representatives have no path between them.
+    """
+    if relationships_cache_key is None:
+        relationships_cache_key = _relationship_mask(allowed_relationships)
+    
+    component_of = gedcom_ctx.component_cache.get(relationships_cache_key)
+    if component_of is None:
+        # Union-find with path halving over the whole-tree adjacency
+        parent = {}
+        
+        def find(person_id):
+            root = parent.setdefault(person_id, person_id)
+            while root != parent[root]:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            return root
+        
+        adjacency = _get_adjacency(allowed_relationships, gedcom_ctx, relationships_cache_key)
+        for person_id, neighbors in adjacency.items():
+            person_root = find(person_id)
+            for neighbor_id, _, _ in neighbors:
+                neighbor_root = find(neighbor_id)
+                if neighbor_root != person_root:
+                    parent[neighbor_root] = person_root
+        
+        component_of = {person_id: find(person_id) for person_id in parent}
+        gedcom_ctx.component_cache[relationships_cache_key] = component_of
+    return component_of
 
 
 def _generate_relationship_chain_lazy(path, allowed_relationships, gedcom_ctx):
@@ -500,6 +536,19 @@ def _generate_relationship_chain_lazy(path, allowed_relationships, gedcom_ctx):
     if len(path) < 2:
         return []
     
+    # Neighbor -> relationship type for each person on the path, built once per person
+    relationships_cache_key = _relationship_mask(allowed_relationships)
+    relationship_index = {}
+    
+    def relationships_of(person_id):
+        index = relationship_index.get(person_id)
+        if index is None:
+            neighbors = _get_person_neighbors_lazy(person_id, allowed_relationships, gedcom_ctx, relationships_cache_key=relationships_cache_key)
+            # Built in reverse so the first listed relationship to a neighbor wins
+            index = {neighbor_id: rel_type for neighbor_id, _, rel_type in reversed(neighbors)}
+            relationship_index[person_id] = index
+        return index
+    
     chain = []
     for i in range(len(path) - 1):
         current = path[i]
@@ -507,32 +556,28 @@ def _generate_relationship_chain_lazy(path, allowed_relationships, gedcom_ctx):
         
         # Get the relationship between current and next
         # First try forward direction
-        neighbors = _get_person_neighbors_lazy(current, allowed_relationships, gedcom_ctx)
         found = False
-        for neighbor_id, weight, rel_type in neighbors:
-            if neighbor_id == next_person:
-                # Fix the relationship direction based on the path direction
-                corrected_rel = _correct_relationship_direction(rel_type, current, next_person, gedcom_ctx)
-                chain.append(corrected_rel)
-                found = True
-                break
+        rel_type = relationships_of(current).get(next_person)
+        if rel_type is not None:
+            # Fix the relationship direction based on the path direction
+            corrected_rel = _correct_relationship_direction(rel_type, current, next_person, gedcom_ctx)
+            chain.append(corrected_rel)
+            found = True
         
         # If not found in forward direction, try reverse direction
         if not found:
-            reverse_neighbors = _get_person_neighbors_lazy(next_person, allowed_relationships, gedcom_ctx)
-            for neighbor_id, weight, rel_type in reverse_neighbors:
-                if neighbor_id == current:
-                    # This is the reverse relationship, so we need to invert it
-                    if rel_type == "parent":
-                        corrected_rel = _correct_relationship_direction("child", current, next_person, gedcom_ctx)
-                    elif rel_type == "child":
-                        corrected_rel = _correct_relationship_direction("parent", current, next_person, gedcom_ctx)
-                    else:
-                        # For bidirectional relationships like spouse/sibling
-                        corrected_rel = _correct_relationship_direction(rel_type, current, next_person, gedcom_ctx)
-                    chain.append(corrected_rel)
-                    found = True
-                    break
+            rel_type = relationships_of(next_person).get(current)
+            if rel_type is not None:
+                # This is the reverse relationship, so we need to invert it
+                if rel_type == "parent":
+                    corrected_rel = _correct_relationship_direction("child", current, next_person, gedcom_ctx)
+                elif rel_type == "child":
+                    corrected_rel = _correct_relationship_direction("parent", current, next_person, gedcom_ctx)
+                else:
+                    # For bidirectional relationships like spouse/sibling
+                    corrected_rel = _correct_relationship_direction(rel_type, current, next_person, gedcom_ctx)
+                chain.append(corrected_rel)
+                found = True
         
         # If still not found, add a fallback
         if not found:
@@ -590,113 +635,125 @@ def _correct_relationship_direction(rel_type, from_person, to_person, gedcom_ctx
         return rel_type
 
 
-def _generate_relationship_description(path, relationship_chain, gedcom_ctx):
-    """Generate a human-readable description of the relationship"""
+def _get_path_record(person_id, gedcom_ctx, record_cache=None):
+    """Get a person record, preferring records already fetched for the path being described"""
+    if record_cache is not None:
+        person = record_cache.get(person_id)
+        if person is not None:
+            return person
+    return get_person_record(person_id, gedcom_ctx)
+
+
+def _generate_relationship_description(path, relationship_chain, gedcom_ctx, record_cache=None, person_names=None):
+    """Generate a human-readable description of the relationship.
+    record_cache optionally maps person IDs on the path to their records, and
+    person_names optionally holds the display name of each person on the path."""
     
     if len(path) == 1:
         return "Same person"
     
     # Get person names for the description
-    person_names = []
-    for person_id in path:
-        person = get_person_record(person_id, gedcom_ctx)
-        person_names.append(person.name if person else "Unknown")
-    
-    if len(path) == 2:
-        rel_desc = _format_relationship_with_gender(relationship_chain[0], path[0], path[1], gedcom_ctx)
-        return f"{person_names[0]} is the {rel_desc} {person_names[1]}"
-    
-    # For longer paths, describe the chain step by step
-    description_parts = [person_names[0]]
-    
-    for i, rel in enumerate(relationship_chain):
-        rel_desc = _format_relationship_with_gender(rel, path[i], path[i + 1], gedcom_ctx)
-        description_parts.append(f"is the {rel_desc}")
-        description_parts.append(person_names[i + 1])
-        
-        # Add connector for next relationship
-        if i < len(relationship_chain) - 1:
-            description_parts.append(", who")
-    
-    return " ".join(description_parts)
+    if person_names is None:
+        person_names = []
+        for person_id in path:
+            person = _get_path_record(person_id, gedcom_ctx, record_cache)
+            person_names.append(person.name if person else "Unknown")
+    
+    # Describe the chain step by step, one "is the <relationship> <name>" per hop,
+    # joined by the connector for the next relationship
+    steps = " , who ".join(
+        f"is the {_format_relationship_with_gender(rel, path[i], path[i + 1], gedcom_ctx, record_cache)} {person_names[i + 1]}"
+        for i, rel in enumerate(relationship_chain)
+    )
+    return f"{person_names[0]} {steps}"
+
+
+# Relationship types whose wording does not depend on anyone's gender
+_REL_FIXED = {
+    "mother_of": "mother of",
+    "father_of": "father of",
+    "parent_of": "parent of",
+    "wife_of": "wife of",
+    "husband_of": "husband of",
+    "sister_of": "sister of",
+    "brother_of": "brother of",
+}
 
+# Relationship types worded by the from-person's gender, mapped to their wording group
+_REL_GENDER_ON = {
+    "child_of_mother": "child_of",
+    "child_of_father": "child_of",
+    "child_of": "child_of",
+    "spouse": "spouse",
+    "spouse_of": "spouse",
+    "sibling": "sibling",
+    "sibling_of": "sibling",
+}
 
-def _format_relationship_with_gender(rel_type, from_person_id, to_person_id, gedcom_ctx):
+# Wording by (group, gender); None covers unknown and other genders
+_REL_BY_GENDER = {
+    ("child_of", "M"): "son of", ("child_of", "F"): "daughter of", ("child_of", None): "child of",
+    ("spouse", "M"): "husband of", ("spouse", "F"): "wife of", ("spouse", None): "spouse of",
+    ("sibling", "M"): "brother of", ("sibling", "F"): "sister of", ("sibling", None): "sibling_of",
+}
+
+# Gender-neutral wording used by _format_relationship_description
+_REL_DESCRIPTIONS = {
+    "child_of": "child of",
+    "child_of_mother": "child of",  # The gender info is in the person name context
+    "child_of_father": "child of",  # The gender info is in the person name context
+    "parent_of": "parent of",
+    "mother_of": "mother of",
+    "father_of": "father of",
+    "spouse": "spouse of",
+    "spouse_of": "spouse of",
+    "wife_of": "wife of",
+    "husband_of": "husband of",
+    "sibling": "sibling of",
+    "sibling_of": "sibling of",
+    "sister_of": "sister of",
+    "brother_of": "brother of",
+}
+
+
+def _format_relationship_with_gender(rel_type, from_person_id, to_person_id, gedcom_ctx, record_cache=None):
     """Format relationship type with gender-specific terms"""
     
-    if rel_type in ["child_of_mother", "child_of_father", "child_of"]:
-        # Check gender of the child (from_person)
-        from_person = get_person_record(from_person_id, gedcom_ctx)
-        if from_person and from_person.gender:
-            if from_person.gender == "M":
-                return "son of"
-            elif from_person.gender == "F":
-                return "daughter of"
-        return "child of"  # fallback if gender unknown
-    elif rel_type == "mother_of":
-        return "mother of"
-    elif rel_type == "father_of":
-        return "father of"
-    elif rel_type == "parent_of":
-        return "parent of"
-    elif rel_type in ["spouse", "spouse_of"]:
-        # Check gender of the spouse (from_person) to determine if they are husband or wife
-        from_person = get_person_record(from_person_id, gedcom_ctx)
-        if from_person and from_person.gender:
-            if from_person.gender == "M":
-                return "husband of"
-            elif from_person.gender == "F":
-                return "wife of"
-        return "spouse of"  # fallback if gender unknown
-    elif rel_type == "wife_of":
-        return "wife of"
-    elif rel_type == "husband_of":
-        return "husband of"
-    elif rel_type in ["sibling", "sibling_of"]:
-        # Could also be "brother of" or "sister of"
-        from_person = get_person_record(from_person_id, gedcom_ctx)
-        if from_person and from_person.gender:
-            if from_person.gender == "M":
-                return "brother of"
-            elif from_person.gender == "F":
-                return "sister of"
-        return "sibling_of"  # fallback if gender unknown
-    elif rel_type == "sister_of":
-        return "sister of"
-    elif rel_type == "brother_of":
-        return "brother of"
-    else:
+    fixed = _REL_FIXED.get(rel_type)
+    if fixed is not None:
+        return fixed
+    
+    group = _REL_GENDER_ON.get(rel_type)
+    if group is None:
         return rel_type
+    
+    # Child, spouse and sibling wording follows the gender of the from_person
+    from_person = _get_path_record(from_person_id, gedcom_ctx, record_cache)
+    gender = from_person.gender if from_person and from_person.gender in ("M", "F") else None
+    return _REL_BY_GENDER[(group, gender)]
 
 
 def _format_relationship_description(rel_type):
     """Format relationship type into readable description"""
-    if rel_type == "child_of":
-        return "child of"
-    elif rel_type == "child_of_mother":
-        return "child of"  # The gender info is in the person name context
-    elif rel_type == "child_of_father":
-        return "child of"  # The gender info is in the person name context
-    elif rel_type == "parent_of":
-        return "parent of"
-    elif rel_type == "mother_of":
-        return "mother of"
-    elif rel_type == "father_of":
-        return "father of"
-    elif rel_type in ["spouse", "spouse_of"]:
-        return "spouse of"
-    elif rel_type == "wife_of":
-        return "wife of"
-    elif rel_type == "husband_of":
-        return "husband of"
-    elif rel_type in ["sibling", "sibling_of"]:
-        return "sibling of"
-    elif rel_type == "sister_of":
-        return "sister of"
-    elif rel_type == "brother_of":
-        return "brother of"
-    else:
-        return rel_type
+    return _REL_DESCRIPTIONS.get(rel_type, rel_type)
+
+def _find_shortest_core(person1_id: str, person2_id: str, allowed: FrozenSet[str], gedcom_ctx, max_distance: int = 30, exclude_initial_spouse_children: bool = False, min_distance: int = 0) -> Tuple[Optional[Tuple[str, ...]], int]:
+    """Find the shortest path between two people without any name or description formatting
+    
+    Returns:
+        (path, distance) with the path as a tuple of person IDs, or (None, -1) if there is none.
+        Results are cached per tree, so callers that only need the distance pay for the search once.
+    """
+    cache_key = (person1_id, person2_id, allowed, max_distance, exclude_initial_spouse_children, min_distance)
+    cached = gedcom_ctx.shortest_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    path, distance = _dijkstra_bidirectional_search(person1_id, person2_id, allowed, gedcom_ctx, max_distance, exclude_initial_spouse_children, min_distance)
+    result = (tuple(path), distance) if path is not None else (None, -1)
+    gedcom_ctx.shortest_cache[cache_key] = result
+    return result
+
 
 def find_shortest_relationship_path(person1_id: str, person2_id: str, allowed_relationships: str, gedcom_ctx, max_distance: int = 30, exclude_initial_spouse_children: bool = False, min_distance: int = 0) -> Dict[str, Any]:
     """Find the shortest relationship path between two people
@@ -730,12 +787,12 @@ def find_shortest_relationship_path(person1_id: str, person2_id: str, allowed_re
         If path exceeds max_distance, returns result with "path_too_long": true
     """
     logger = logging.getLogger(__name__)
+    # The PERF messages are f-strings, so only build them when INFO is actually logged
+    log_perf = logger.isEnabledFor(logging.INFO)
     
     # Validate that both people exist
     person1 = get_person_record(person1_id, gedcom_ctx)
     person2 = get_person_record(person2_id, gedcom_ctx)
-    person1 = get_person_record(person1_id, gedcom_ctx)
-    person2 = get_person_record(person2_id, gedcom_ctx)
     
     if not person1:
         return {"error": f"Person not found: {person1_id}"}
@@ -753,117 +810,83 @@ def find_shortest_relationship_path(person1_id: str, person2_id: str, allowed_re
     # Validate max_distance
     if max_distance < 1:
         max_distance = 30
+    
+    # Sessions re-query the same pairs, so results are cached without their timings.
+    # The raw allowed_relationships string is part of the key since descriptions quote it.
+    start_time = time.time()
+    cache_key = (person1_id, person2_id, allowed_relationships, max_distance, exclude_initial_spouse_children, min_distance)
+    cached = gedcom_ctx.path_cache.get(cache_key)
+    if cached is not None:
+        # Each caller gets its own top-level dict; the nested lists are shared and must not be modified
+        result = dict(cached)
+        if result["path"] is not None:
+            result["performance"] = {"total_time": time.time() - start_time, "cache_hit": True}
+        return result
         
     try:
-        import time
-        start_time = time.time()
         
         # Parse allowed relationships
         parse_start = time.time()
-        allowed = set()
-        allowed_relationships_lower = allowed_relationships.lower()
-        
-        if allowed_relationships_lower == "all":
-            allowed = {"parent", "spouse", "sibling", "child"}
-        elif allowed_relationships_lower == "default":
-            allowed = {"parent", "spouse", "child"}  # Default: spouse, parents, children
-        elif allowed_relationships_lower == "blood":
-            allowed = {"parent", "child"}  # Blood relationships only
-        elif allowed_relationships_lower == "parents":
-            allowed = {"parent"}  # Parents only (both mother and father)
-        elif allowed_relationships_lower == "children":
-            allowed = {"child"}  # Children only
-        else:
-            # Parse comma-separated list and expand special types
-            raw_relationships = {rel.strip().lower() for rel in allowed_relationships.split(",")}
-            allowed = set()
-            
-            for rel in raw_relationships:
-                if rel == "spouse":
-                    allowed.add("spouse")
-                elif rel == "mother":
-                    allowed.add("mother")  # Will be handled specially in neighbor function
-                elif rel == "father":
-                    allowed.add("father")  # Will be handled specially in neighbor function
-                elif rel == "parents":
-                    allowed.add("parent")  # Both mother and father
-                elif rel == "children":
-                    allowed.add("child")
-                elif rel == "blood":
-                    allowed.update({"parent", "child"})
-                elif rel == "sibling":
-                    allowed.add("sibling")
-                elif rel == "parent":
-                    allowed.add("parent")
-                elif rel == "child":
-                    allowed.add("child")
-                elif rel == "all":
-                    allowed.update({"parent", "spouse", "sibling", "child"})
-                else:
-                    logger.warning(f"Unknown relationship type: {rel}")
-        
+        allowed = _parse_allowed(allowed_relationships)
         parse_time = time.time() - parse_start
-        logger.info(f"PERF: Relationship parsing took {parse_time:.3f}s, allowed: {allowed}")
+        if log_perf:
+            logger.info(f"PERF: Relationship parsing took {parse_time:.3f}s, allowed: {allowed}")
         
         # Use optimized lazy bidirectional search
         search_start = time.time()
-        logger.info(f"PERF: Starting bidirectional search (max distance: {max_distance}, min distance: {min_distance})")
-        path, distance = _dijkstra_bidirectional_search(person1_id, person2_id, allowed, gedcom_ctx, max_distance, exclude_initial_spouse_children, min_distance)
+        if log_perf:
+            logger.info(f"PERF: Starting bidirectional search (max distance: {max_distance}, min distance: {min_distance})")
+        path, distance = _find_shortest_core(person1_id, person2_id, allowed, gedcom_ctx, max_distance, exclude_initial_spouse_children, min_distance)
         
         search_time = time.time() - search_start
-        logger.info(f"PERF: Bidirectional search took {search_time:.3f}s")
+        if log_perf:
+            logger.info(f"PERF: Bidirectional search took {search_time:.3f}s")
 
         
         if path is None:
             total_time = time.time() - start_time
-            logger.info(f"PERF: Total time (no path found): {total_time:.3f}s")
+            if log_perf:
+                logger.info(f"PERF: Total time (no path found): {total_time:.3f}s")
             if min_distance > 0:
-                return {
+                result = {
                     "path": None,
                     "distance": -1,
                     "relationship_chain": [],
                     "description": f"No relationship path found with minimum distance {min_distance} using allowed relationship types: {allowed_relationships}. Try reducing min_distance or using different relationship types."
                 }
             else:
-                return {
+                result = {
                     "path": None,
                     "distance": -1,
                     "relationship_chain": [],
                     "description": f"No relationship path found with allowed relationship types: {allowed_relationships}"
                 }
+            gedcom_ctx.path_cache[cache_key] = result
+            return dict(result)
+        
+        # Every person on the path is described several times below, so fetch each record
+        # and name once and share them between the description and the path listing
+        names_start = time.time()
+        records = {person_id: get_person_record(person_id, gedcom_ctx) for person_id in path}
+        person_names = [records[person_id].name if records[person_id] else "Unknown" for person_id in path]
+        path_with_names = [{"id": person_id, "name": name} for person_id, name in zip(path, person_names)]
+        names_time = time.time() - names_start
+        if log_perf:
+            logger.info(f"PERF: Name lookup took {names_time:.3f}s for {len(path)} people")
         
         # Generate relationship chain description
         chain_start = time.time()
         relationship_chain = _generate_relationship_chain_lazy(path, allowed, gedcom_ctx)
-        description = _generate_relationship_description(path, relationship_chain, gedcom_ctx)
-        chain_time = time.time() - chain_start
-        logger.info(f"PERF: Relationship chain generation took {chain_time:.3f}s")
-        
-        # Get person names for the path and create detailed description
-        names_start = time.time()
-        path_with_names = []
-        detailed_path_description = []
+        description = _generate_relationship_description(path, relationship_chain, gedcom_ctx, records, person_names)
         
-        for i, person_id in enumerate(path):
-            person = get_person_record(person_id, gedcom_ctx)
-            person_name = person.name if person else "Unknown"
-            path_with_names.append({
-                "id": person_id,
-                "name": person_name
-            })
-            
-            # Create step-by-step description
-            if i < len(path) - 1:  # Not the last person
-                rel_type = relationship_chain[i]
-                next_person = get_person_record(path[i + 1], gedcom_ctx)
-                next_name = next_person.name if next_person else "Unknown"
-                
-                # Create step-by-step description with proper gender formatting
-                formatted_rel_type = _format_relationship_with_gender(rel_type, person_id, path[i + 1], gedcom_ctx)
-                detailed_path_description.append(f"{person_name} -> {formatted_rel_type} -> {next_name}")
-        
-        names_time = time.time() - names_start
-        logger.info(f"PERF: Name lookup took {names_time:.3f}s for {len(path)} people")
+        # Create step-by-step description with proper gender formatting
+        detailed_path_description = [
+            f"{person_names[i]} -> {_format_relationship_with_gender(rel_type, path[i], path[i + 1], gedcom_ctx, records)} -> {person_names[i + 1]}"
+            for i, rel_type in enumerate(relationship_chain)
+        ]
+        chain_time = time.time() - chain_start
+        if log_perf:
+            logger.info(f"PERF: Relationship chain generation took {chain_time:.3f}s")
         
         # Build performance info
         performance_info = {
@@ -871,7 +894,8 @@ def find_shortest_relationship_path(person1_id: str, person2_id: str, allowed_re
             "search_time": search_time,
             "chain_generation_time": chain_time,
             "name_lookup_time": names_time,
-            "algorithm_used": "bidirectional_lazy"
+            "algorithm_used": "bidirectional_lazy",
+            "cache_hit": False
         }
         
         result = {
@@ -882,14 +906,15 @@ def find_shortest_relationship_path(person1_id: str, person2_id: str, allowed_re
             "relationship_chain": relationship_chain,
             "description": description,
             "detailed_path": detailed_path_description,
-            "allowed_relationships": list(allowed),
-            "performance": performance_info
+            "allowed_relationships": list(allowed)
         }
         
         total_time = time.time() - start_time
-        logger.info(f"PERF: Total shortest path operation took {total_time:.3f}s")
+        if log_perf:
+            logger.info(f"PERF: Total shortest path operation took {total_time:.3f}s")
         
-        return result
+        gedcom_ctx.path_cache[cache_key] = result
+        return {**result, "performance": performance_info}
     
     except Exception as e:
         return {"error": f"Error finding relationship path: {e}\n{traceback.format_exc()}"}
@@ -961,22 +986,24 @@ def _find_all_relationship_paths_internal(person1_id: str, person2_id: str, allo
         # Limit to max_paths
         all_paths = all_paths[:max_paths]
         
+        # Paths share most of their people, so each record is fetched once for all of them
+        records = {}
+        
         # Generate relationship chains and descriptions for each path
         for path_info in all_paths:
             path = path_info["path"]
+            for person_id in path:
+                if person_id not in records:
+                    records[person_id] = get_person_record(person_id, gedcom_ctx)
+            person_names = [records[person_id].name if records[person_id] else "Unknown" for person_id in path]
             relationship_chain = _generate_relationship_chain_lazy(path, allowed, gedcom_ctx)
-            description = _generate_relationship_description(path, relationship_chain, gedcom_ctx)
+            description = _generate_relationship_description(path, relationship_chain, gedcom_ctx, records, person_names)
             
             path_info["relationship_chain"] = relationship_chain
             path_info["description"] = description
             
             # Add person names to path
-            path_with_names = []
-            for person_id in path:
-                person = get_person_record(person_id, gedcom_ctx)
-                person_name = person.name if person else "Unknown"
-                path_with_names.append({"id": person_id, "name": person_name})
-            path_info["path"] = path_with_names
+            path_info["path"] = [{"id": person_id, "name": name} for person_id, name in zip(path, person_names)]
         
         total_time = time.time() - start_time
         
@@ -993,21 +1020,52 @@ def _find_all_relationship_paths_internal(person1_id: str, person2_id: str, allo
     except Exception as e:
         return {"error": f"Error finding all relationship paths: {e}\n{traceback.format_exc()}"}
 
+
+# Stack marker for _find_all_paths_dfs: the node below it has been fully explored
+_DFS_EXIT = object()
+
+
 def _find_all_paths_dfs(start_node, end_node, allowed_relationships, gedcom_ctx, max_depth, max_paths):
     """Internal DFS function to find all paths"""
     all_paths = []
     
-    # We'll use a stack for DFS, storing tuples of (current_node, path_list)
-    stack = [(start_node, [start_node])]
+    # The whole-tree adjacency is built once per relationship set and shared with the
+    # shortest-path search, so expanding a node is a single dict lookup
+    relationships_cache_key = _relationship_mask(allowed_relationships)
+    adjacency = _get_adjacency(allowed_relationships, gedcom_ctx, relationships_cache_key)
+    
+    # Without a connection every branch would be walked out to max_depth for nothing
+    component_of = _get_components(allowed_relationships, gedcom_ctx, relationships_cache_key)
+    if component_of.get(start_node) != component_of.get(end_node):
+        return all_paths
+    
+    # A branch can only reach end_node if its length so far plus the person's distance to
+    # end_node fits in max_depth. Distances come from a BFS out of end_node, which walks the
+    # edges backwards correctly only when every edge has its reverse in the adjacency.
+    if _is_symmetric_mask(relationships_cache_key):
+        dist_to_target = _distances_from(end_node, adjacency, max_depth)
+    else:
+        dist_to_target = None
+    
+    # One shared path and set are extended on entry to a node and undone when its exit marker
+    # is popped, after the node's whole branch; pushes no longer copy the path. Paths are only
+    # copied when one reaches end_node.
+    stack = [start_node]
+    path = []
+    on_path = set()
     
     while stack:
-        current_node, path = stack.pop()
+        current_node = stack.pop()
+        if current_node is _DFS_EXIT:
+            on_path.discard(path.pop())
+            continue
         
         # If we found the end node, add this path to our results
         if current_node == end_node:
+            found_path = path + [current_node]
             all_paths.append({
-                "path": path,
-                "distance": len(path) - 1
+                "path": found_path,
+                "distance": len(found_path) - 1
             })
             # Stop if we've found enough paths
             if len(all_paths) >= max_paths:
@@ -1015,20 +1073,53 @@ def _find_all_paths_dfs(start_node, end_node, allowed_relationships, gedcom_ctx,
             continue # Don't explore further from the end node
         
         # If the path is too long, stop exploring this branch
-        if len(path) > max_depth:
+        if len(path) + 1 > max_depth:
             continue
-            
+        
+        path.append(current_node)
+        on_path.add(current_node)
+        stack.append(_DFS_EXIT)
+        
         # Get neighbors and add them to the stack
-        neighbors = _get_person_neighbors_lazy(current_node, allowed_relationships, gedcom_ctx)
+        neighbors = adjacency.get(current_node, ())
         
         for neighbor_id, weight, rel_type in neighbors:
             # Avoid cycles by not revisiting nodes in the current path
-            if neighbor_id not in path:
-                new_path = path + [neighbor_id]
-                stack.append((neighbor_id, new_path))
+            if neighbor_id in on_path:
+                continue
+            # Skip branches that cannot reach end_node within max_depth
+            if dist_to_target is not None and len(path) + dist_to_target.get(neighbor_id, INF) > max_depth:
+                continue
+            stack.append(neighbor_id)
                 
     return all_paths
 
+
+def _is_symmetric_mask(relationship_mask: int) -> bool:
+    """Whether every edge allowed by the mask comes with its reverse edge.
+    Spouse and sibling edges are mutual; a parent edge is reversed by a child edge only
+    when all parents are allowed, not just mothers or fathers."""
+    parent_bits = relationship_mask & _PARENT_BITS
+    if relationship_mask & REL_CHILD:
+        return bool(parent_bits & REL_PARENT)
+    return not parent_bits
+
+
+def _distances_from(origin, adjacency, max_distance):
+    """Breadth-first hop counts from origin to everyone within max_distance"""
+    distances = {origin: 0}
+    queue = deque([origin])
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+        if distance > max_distance:
+            continue
+        for neighbor, weight, relationship_type in adjacency.get(node, ()):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+    return distances
+
 def _filter_redundant_paths(paths, gedcom_ctx):
     """Filter out paths that are simply longer versions of shorter paths.
     
@@ -1041,58 +1132,17 @@ def _filter_redundant_paths(paths, gedcom_ctx):
     # Sort paths by length (shortest first)
     paths.sort(key=lambda p: len(p["path"]))
     
-    unique_paths = []
-    
-    for i, p1 in enumerate(paths):
-        is_redundant = False
-        for j, p2 in enumerate(paths):
-            if i == j:
-                continue
-            
-            # If p1's path is a sub-path of p2's path, then p2 is redundant
-            # This is a simple check - more complex redundancy could exist
-            if len(p1["path"]) < len(p2["path"]):
-                # Check if p1 is a subsequence of p2
-                # This is not perfect, but a good heuristic
-                if all(item in p2["path"] for item in p1["path"]):
-                    # This is a weak check, let's do a stronger one
-                    # Check if p1 is a contiguous sublist of p2
-                    is_sublist = False
-                    for k in range(len(p2["path"]) - len(p1["path"]) + 1):
-                        if p2["path"][k:k+len(p1["path"])] == p1["path"]:
-                            is_sublist = True
-                            break
-                    
-                    if is_sublist:
-                        # p1 is a sublist of p2, so p2 is redundant if we already have p1
-                        # But we are iterating from shortest to longest, so we just need to check
-                        # if p1 makes p2 redundant
-                        pass
-            
-            # A better check: if p2 contains all nodes of p1, and is longer, it's likely redundant
-            if set(p1["path"]).issubset(set(p2["path"])) and len(p1["path"]) < len(p2["path"]):
-                # This is a good sign of redundancy, especially if they share start/end nodes
-                if p1["path"][0] == p2["path"][0] and p1["path"][-1] == p2["path"][-1]:
-                    is_redundant = True
-                    # We can't break here, because p1 might be redundant with another path
-                    # But we can mark p1 as redundant if it's a superset of a shorter path
-    
-    # This is still not quite right. A simpler filter:
-    # For each path, check if any other path is "better".
-    # A path is "better" if it's shorter and connects the same two people.
-    # But we already sorted by length, so we just need to remove longer paths
-    # that are supersets of shorter paths.
-    
+    # A longer path is redundant when it visits every person of a shorter kept path.
+    # Checking kept paths is enough: a path dropped for containing a kept one passes
+    # that containment on to anything containing it.
     final_paths = []
-    for i in range(len(paths)):
-        is_redundant = False
-        for j in range(i):
-            # If path i is a superset of a shorter path j
-            if set(paths[j]["path"]).issubset(set(paths[i]["path"])):
-                is_redundant = True
-                break
-        if not is_redundant:
-            final_paths.append(paths[i])
+    kept_nodesets = []
+    for path_info in paths:
+        nodeset = frozenset(path_info["path"])
+        if any(kept <= nodeset for kept in kept_nodesets):
+            continue
+        kept_nodesets.append(nodeset)
+        final_paths.append(path_info)
             
     return final_paths
 
@@ -1128,35 +1178,34 @@ def _find_all_paths_to_ancestor_internal(start_person_id: str, ancestor_id: str,
     
     all_paths = []
     
-    def dfs_find_ancestor_paths(current_id: str, current_path: List[str], visited: Set[str]):
-        # Limit the number of paths we return
-        if len(all_paths) >= max_paths:
-            return
+    # Iterative DFS: path holds the people from start_person_id down to the current one, and
+    # stack[i] iterates the parents of path[i] that are still to be explored
+    path = [start_person_id]
+    visited = {start_person_id}
+    stack = [iter(start_person.parents or ())]
+    
+    # Limit the number of paths we return
+    while stack and len(all_paths) < max_paths:
+        parent_id = next(stack[-1], None)
+        if parent_id is None:
+            # Every parent of the current person has been explored, step back to the child
+            stack.pop()
+            visited.discard(path.pop())
+            continue
         
-        # If we've found the ancestor, add this path to our results
-        if current_id == ancestor_id:
-            all_paths.append(current_path.copy())
-            return
+        # Avoid cycles
+        if parent_id in visited:
+            continue
         
-        # Get the current person's details
-        person = get_person_record(current_id, gedcom_ctx)
-        if not person or not person.parents:
-            return
+        # If we've found the ancestor, add this path to our results
+        if parent_id == ancestor_id:
+            all_paths.append(path + [parent_id])
+            continue
         
-        # Explore each parent
-        for parent_id in person.parents:
-            # Avoid cycles
-            if parent_id not in visited:
-                visited.add(parent_id)
-                current_path.append(parent_id)
-                dfs_find_ancestor_paths(parent_id, current_path, visited)
-                current_path.pop()
-                visited.remove(parent_id)
-    
-    # Start the search
-    visited = {start_person_id}
-    path = [start_person_id]
-    dfs_find_ancestor_paths(start_person_id, path, visited)
+        # Explore the parent's own parents next
+        person = get_person_record(parent_id, gedcom_ctx)
+        path.append(parent_id)
+        visited.add(parent_id)
+        stack.append(iter(person.parents if person and person.parents else ()))
     
     return all_paths
-
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 import re
-from typing import Optional, Any, Dict
+import unicodedata
+from functools import lru_cache
+from typing import Optional, Any, Dict, List, Tuple
 from .gedcom_models import PersonDetails
 from .gedcom_constants import EVENT_TYPES, ATTRIBUTE_TYPES
 
@@ -34,60 +36,62 @@ except ImportError:
     PLACE_UTILS_AVAILABLE = False
 
 
-_HUMAN_EVENT_TO_GEDCOM_TAG = {
-    details["name"].lower(): tag for tag, details in EVENT_TYPES.items()
+# Maximum number of distinct strings kept by the normalize_string cache
+NORMALIZE_CACHE_SIZE = 65536
+
+# Patterns used on every normalize_string call and year fallback, compiled once
+_WS_RE = re.compile(r'\s+')
+# Years 1000-2099 as a whole word, as in "1850", "ABT 1850" or "BET 1850 AND 1855"
+_YEAR_RE = re.compile(r'\b(1[0-9]{3}|20[0-9]{2})\b')
+
+# Casefolded human-readable names and GEDCOM tags -> GEDCOM tag; tags win on a clash
+_EVENT_TAG_INDEX = {
+    **{details["name"].casefold(): tag for tag, details in EVENT_TYPES.items()},
+    **{tag.casefold(): tag for tag in EVENT_TYPES},
 }
 
-_HUMAN_ATTRIBUTE_TO_GEDCOM_TAG = {
-    details["name"].lower(): tag for tag, details in ATTRIBUTE_TYPES.items()
+_ATTRIBUTE_TAG_INDEX = {
+    **{details["name"].casefold(): tag for tag, details in ATTRIBUTE_TYPES.items()},
+    **{tag.casefold(): tag for tag in ATTRIBUTE_TYPES},
 }
 
 def normalize_string(text: str) -> str:
     """Normalize string for comparison - removes accents, converts to lowercase, and normalizes whitespace
     
-    Uses unidecode if available to handle accented characters (é → e, ñ → n, etc.)
-    Falls back to simple case folding if unidecode is not installed.
+    Strips accents by NFKD decomposition (é → e, ñ → n, etc.); characters that do not
+    decompose to ASCII (ø, ß, CJK) are transliterated with unidecode if it is installed.
     
     To install unidecode: pip install unidecode
     """
     if isinstance(text, str):
-        # Normalize whitespace to single spaces
-        text = re.sub(r'\s+', ' ', text.strip())
-        if UNIDECODE_AVAILABLE:
-            return unidecode(text).casefold()
-        else:
-            # Fallback without unidecode - just case normalization
-            return text.casefold()
+        return _normalize_string_cached(text)
     else:
         return text
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_string_cached(text: str) -> str:
+    """Normalize a string; memoized since query terms, places and occupations repeat a lot."""
+    # Normalize whitespace to single spaces
+    text = _WS_RE.sub(' ', text.strip())
+    if not text.isascii():
+        # Decomposing and dropping combining marks covers most accented Latin names in C
+        text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+        if UNIDECODE_AVAILABLE and not text.isascii():
+            text = unidecode(text)
+    return text.casefold()
+
+
 def _get_gedcom_tag_from_event_type(event_type_input: str) -> Optional[str]:
     """Converts a human-readable event name or a GEDCOM tag to a standardized GEDCOM tag."""
-    # First, check if it's already a valid GEDCOM tag
-    if event_type_input.upper() in EVENT_TYPES:
-        return event_type_input.upper()
-    
-    # Then, try to match human-readable name (case-insensitive)
-    normalized_input = event_type_input.lower()
-    if normalized_input in _HUMAN_EVENT_TO_GEDCOM_TAG:
-        return _HUMAN_EVENT_TO_GEDCOM_TAG[normalized_input]
-    
-    return None  # No matching tag found
+    # Tags and names share one case-insensitive index; None if nothing matches
+    return _EVENT_TAG_INDEX.get(event_type_input.casefold())
 
 
 def _get_gedcom_tag_from_attribute_type(attribute_type_input: str) -> Optional[str]:
     """Converts a human-readable attribute name or a GEDCOM tag to a standardized GEDCOM tag."""
-    # First, check if it's already a valid GEDCOM tag
-    if attribute_type_input.upper() in ATTRIBUTE_TYPES:
-        return attribute_type_input.upper()
-    
-    # Then, try to match human-readable name (case-insensitive)
-    normalized_input = attribute_type_input.lower()
-    if normalized_input in _HUMAN_ATTRIBUTE_TO_GEDCOM_TAG:
-        return _HUMAN_ATTRIBUTE_TO_GEDCOM_TAG[normalized_input]
-    
-    return None  # No matching tag found
+    # Tags and names share one case-insensitive index; None if nothing matches
+    return _ATTRIBUTE_TAG_INDEX.get(attribute_type_input.casefold())
 
 
 def _extract_year_from_genealogy_date(date_str: str) -> Optional[int]:
@@ -114,7 +118,7 @@ def _extract_year_from_genealogy_date(date_str: str) -> Optional[int]:
     
     # Extract year from various date formats using regex as fallback
     # Common GEDCOM date formats: "1850", "ABT 1850", "BEF 1850", "AFT 1850", "BET 1850 AND 1855"
-    year_match = re.search(r'\b(1[0-9]{3}|20[0-9]{2})\b', str(date_str))
+    year_match = _YEAR_RE.search(str(date_str))
     if year_match:
         return int(year_match.group(1))
     
@@ -236,17 +240,32 @@ def extract_birth_year(person_id: str, gedcom_ctx):
     return None
 
 
+# Criteria matched as case- and accent-insensitive substrings
+_SUBSTRING_CRITERIA = frozenset({"occupation", "birth_place_contains", "death_place_contains", "name_contains"})
+
+
+def _compile_criteria(criteria: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """Prepare filter criteria once so the per-person checks do not re-normalize the query terms"""
+    return [
+        (key, normalize_string(value) if key in _SUBSTRING_CRITERIA else value)
+        for key, value in criteria.items()
+    ]
+
+
 def _matches_criteria(person: PersonDetails, criteria: Dict[str, Any]) -> bool:
     """Check if a person matches the given criteria"""
-    import re
-    
-    for key, value in criteria.items():
+    return _matches_compiled(person, _compile_criteria(criteria))
+
+
+def _matches_compiled(person: PersonDetails, compiled: List[Tuple[str, Any]]) -> bool:
+    """Check if a person matches criteria prepared by _compile_criteria"""
+    for key, value in compiled:
         if key == "occupation":
             if value is None:
                 if person.occupation is not None:
                     return False
             else:
-                if not person.occupation or normalize_string(value) not in normalize_string(person.occupation):
+                if not person.occupation or value not in normalize_string(person.occupation):
                     return False
         
         elif key == "birth_year_range":
@@ -280,15 +299,15 @@ def _matches_criteria(person: PersonDetails, criteria: Dict[str, Any]) -> bool:
                         return False
         
         elif key == "birth_place_contains":
-            if not person.birth_place or normalize_string(value) not in normalize_string(person.birth_place):
+            if not person.birth_place or value not in normalize_string(person.birth_place):
                 return False
         
         elif key == "death_place_contains":
-            if not person.death_place or normalize_string(value) not in normalize_string(person.death_place):
+            if not person.death_place or value not in normalize_string(person.death_place):
                 return False
         
         elif key == "name_contains":
-            if not person.name or normalize_string(value) not in normalize_string(person.name):
+            if not person.name or value not in normalize_string(person.name):
                 return False
         
         elif key == "gender":
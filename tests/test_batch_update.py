@@ -62,7 +62,7 @@ class TestBatchUpdatePersonAttributesInternal(unittest.TestCase):
     def test_batch_update_success(self, mock_update_attr):
         """Test successful batch update"""
         self.gedcom_ctx.gedcom_parser = MagicMock()
-        mock_update_attr.return_value = "Successfully updated attribute"
+        mock_update_attr.return_value = (True, "Successfully updated attribute")
         
         updates = [
             {
@@ -91,8 +91,8 @@ class TestBatchUpdatePersonAttributesInternal(unittest.TestCase):
         """Test batch update with partial failure"""
         self.gedcom_ctx.gedcom_parser = MagicMock()
         mock_update_attr.side_effect = [
-            "Successfully updated attribute",
-            "Error: Person not found"
+            (True, "Successfully updated attribute"),
+            (False, "Error: Person not found")
         ]
         
         updates = [
@@ -115,6 +115,7 @@ class TestBatchUpdatePersonAttributesInternal(unittest.TestCase):
         self.assertEqual(result["successful"], 1)
         self.assertEqual(result["failed"], 1)
         self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["error"], "Error: Person not found")
         self.assertEqual(mock_update_attr.call_count, 2)
 
 if __name__ == '__main__':
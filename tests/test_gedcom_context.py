@@ -1,13 +1,14 @@
 import os
 import sys
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.gedcom_mcp.parser.gedcom_context import GedcomContext, _rebuild_lookups, get_gedcom_context
-from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file
+from src.gedcom_mcp.parser.gedcom_context import GedcomContext, _rebuild_lookups, get_gedcom_context, _cache_size
+from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file, get_person_record
 
 
 class TestGedcomContext(unittest.TestCase):
@@ -32,6 +33,14 @@ class TestGedcomContext(unittest.TestCase):
         self.assertIsNotNone(self.gedcom_ctx.person_relationships_cache)
         self.assertIsNotNone(self.gedcom_ctx.neighbor_cache)
 
+    def test_cache_size_env_override(self):
+        with patch.dict(os.environ, {"GEDCOM_CACHE_NEIGHBOR": "123"}):
+            self.assertEqual(_cache_size("neighbor", 10), 123)
+        with patch.dict(os.environ, {"GEDCOM_CACHE_NEIGHBOR": "lots"}):
+            self.assertEqual(_cache_size("neighbor", 10), 10)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(_cache_size("neighbor", 10), 10)
+
     def test_clear_caches(self):
         """Test that clear_caches method works"""
         # Add some items to caches
@@ -52,6 +61,27 @@ class TestGedcomContext(unittest.TestCase):
         self.assertEqual(len(self.gedcom_ctx.person_relationships_cache), 0)
         self.assertEqual(len(self.gedcom_ctx.neighbor_cache), 0)
 
+    def test_person_details_admitted_on_second_request(self):
+        sample_ged_path = Path(__file__).parent / "sample.ged"
+        load_gedcom_file(str(sample_ged_path), self.gedcom_ctx)
+        first = get_person_record("@I1@", self.gedcom_ctx)
+        self.assertNotIn("@I1@", self.gedcom_ctx.person_details_cache)
+        second = get_person_record("@I1@", self.gedcom_ctx)
+        self.assertEqual(first, second)
+        self.assertIs(self.gedcom_ctx.person_details_cache["@I1@"], second)
+
+    def test_person_details_history_reset_on_load(self):
+        sample_ged_path = Path(__file__).parent / "sample.ged"
+        load_gedcom_file(str(sample_ged_path), self.gedcom_ctx)
+        get_person_record("@I1@", self.gedcom_ctx)
+        # Edits keep the admission history; loading a tree starts it over
+        self.gedcom_ctx.clear_caches()
+        self.assertIn("@I1@", self.gedcom_ctx.person_details_seen)
+        load_gedcom_file(str(sample_ged_path), self.gedcom_ctx)
+        self.assertNotIn("@I1@", self.gedcom_ctx.person_details_seen)
+        get_person_record("@I1@", self.gedcom_ctx)
+        self.assertNotIn("@I1@", self.gedcom_ctx.person_details_cache)
+
     def test_rebuild_lookups(self):
         """Test that _rebuild_lookups works with a loaded GEDCOM file"""
         # Load a sample GEDCOM file
@@ -66,6 +96,16 @@ class TestGedcomContext(unittest.TestCase):
         self.assertGreater(len(self.gedcom_ctx.individual_lookup), 0)
         self.assertGreater(len(self.gedcom_ctx.family_lookup), 0)
 
+    def test_rebuild_lookups_indexes_xrefs(self):
+        """Test that _rebuild_lookups indexes cross-reference child elements"""
+        sample_ged_path = Path(__file__).parent / "sample.ged"
+        load_gedcom_file(str(sample_ged_path), self.gedcom_ctx)
+
+        chil = self.gedcom_ctx.xref[("@F1@", "CHIL", "@I3@")]
+        self.assertEqual(chil.get_tag(), "CHIL")
+        self.assertEqual(chil.get_value(), "@I3@")
+        self.assertIn(("@I3@", "FAMC", "@F1@"), self.gedcom_ctx.xref)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
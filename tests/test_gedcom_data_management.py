@@ -38,6 +38,17 @@ class TestGedcomDataManagement(unittest.TestCase):
         child = self.gedcom_ctx.individual_lookup["@I3@"]
         famc_tags = [el.get_value() for el in child.get_child_elements() if el.get_tag() == "FAMC"]
         self.assertNotIn("@F1@", famc_tags)
+        self.assertNotIn(("@F1@", "CHIL", "@I3@"), self.gedcom_ctx.xref)
+        self.assertNotIn(("@I3@", "FAMC", "@F1@"), self.gedcom_ctx.xref)
+
+    def test_add_and_remove_child_keeps_xref_index(self):
+        _remove_child_from_family_internal(self.gedcom_ctx, "@I3@", "@F1@")
+        _add_child_to_family_internal(self.gedcom_ctx, "@I3@", "@F1@")
+        self.assertIn(("@F1@", "CHIL", "@I3@"), self.gedcom_ctx.xref)
+        result = _remove_child_from_family_internal(self.gedcom_ctx, "@I3@", "@F1@")
+        self.assertIn("successfully", result.lower())
+        result = _remove_child_from_family_internal(self.gedcom_ctx, "@I3@", "@F1@")
+        self.assertTrue(result.startswith("Error"))
 
     def test_remove_parent_from_family_internal(self):
         _remove_parent_from_family_internal(self.gedcom_ctx, "@I1@", "@F1@")
@@ -48,17 +59,57 @@ class TestGedcomDataManagement(unittest.TestCase):
         _update_event_details_internal(self.gedcom_ctx, "@I1@", "BIRT", new_date="2 JAN 1970")
         person = get_person_record("@I1@", self.gedcom_ctx)
         self.assertEqual(person.birth_date, "2 JAN 1970")
+        self.assertEqual((person.birth_year, person.birth_month, person.birth_day), (1970, 1, 2))
 
     def test_update_person_attribute_internal(self):
-        _update_person_attribute_internal(self.gedcom_ctx, "@I1@", "OCCU", "Doctor")
+        ok, _ = _update_person_attribute_internal(self.gedcom_ctx, "@I1@", "OCCU", "Doctor")
+        self.assertTrue(ok)
         person = get_person_record("@I1@", self.gedcom_ctx)
         self.assertEqual(person.occupation, "Doctor")
 
+    def test_update_person_attribute_internal_xref(self):
+        ok, _ = _update_person_attribute_internal(self.gedcom_ctx, "@I1@", "FAMS", "@F2@")
+        self.assertTrue(ok)
+        self.assertNotIn(("@I1@", "FAMS", "@F1@"), self.gedcom_ctx.xref)
+        self.assertIn(("@I1@", "FAMS", "@F2@"), self.gedcom_ctx.xref)
+
+        # Removing @I1@ from @F1@ must not take the updated reference with it
+        _remove_parent_from_family_internal(self.gedcom_ctx, "@I1@", "@F1@")
+        person = self.gedcom_ctx.individual_lookup["@I1@"]
+        fams = [el.get_value() for el in person.get_child_elements() if el.get_tag() == "FAMS"]
+        self.assertEqual(fams, ["@F2@"])
+
+        result = _remove_person_attribute_internal(self.gedcom_ctx, "@I1@", "FAMS")
+        self.assertIn("successfully", result.lower())
+        self.assertNotIn(("@I1@", "FAMS", "@F2@"), self.gedcom_ctx.xref)
+
     def test_update_person_details_internal(self):
         _update_person_details_internal(self.gedcom_ctx, "@I1@", name="John Doe")
         person = get_person_record("@I1@", self.gedcom_ctx)
         self.assertEqual(person.name, "John Doe")
 
+    def test_update_person_details_internal_givn_surn(self):
+        person = self.gedcom_ctx.individual_lookup["@I1@"]
+        name_element = next(el for el in person.get_child_elements() if el.get_tag() == "NAME")
+        givn = name_element.new_child_element("GIVN", value="John")
+        surn = name_element.new_child_element("SURN", value="Smith")
+
+        _update_person_details_internal(self.gedcom_ctx, "@I1@", name="Jane Mary /Doe/ Jr")
+        self.assertEqual(givn.get_value(), "Jane Mary")
+        self.assertEqual(surn.get_value(), "Doe")
+
+        _update_person_details_internal(self.gedcom_ctx, "@I1@", name="Anna Brown")
+        self.assertEqual(givn.get_value(), "Anna")
+        self.assertEqual(surn.get_value(), "Brown")
+
+        _update_person_details_internal(self.gedcom_ctx, "@I1@", name="/Doe/")
+        self.assertEqual(givn.get_value(), "")
+        self.assertEqual(surn.get_value(), "Doe")
+
+        _update_person_details_internal(self.gedcom_ctx, "@I1@", name="John /Doe")
+        self.assertEqual(givn.get_value(), "John")
+        self.assertEqual(surn.get_value(), "Doe")
+
     def test_new_empty_gedcom_internal(self):
         _new_empty_gedcom_internal(self.gedcom_ctx)
         self.assertEqual(len(self.gedcom_ctx.individual_lookup), 0)
@@ -88,6 +139,14 @@ class TestGedcomDataManagement(unittest.TestCase):
         result = _add_note_to_entity_internal(self.gedcom_ctx, "@I1@", "This is a test note for John Smith")
         self.assertIn("successfully", result.lower())
 
+    def test_add_note_to_entity_internal_missing_note_id(self):
+        # Referencing an unknown note must not add a dangling NOTE reference
+        person = self.gedcom_ctx.individual_lookup["@I1@"]
+        child_count = len(person.get_child_elements())
+        result = _add_note_to_entity_internal(self.gedcom_ctx, "@I1@", "Extra text", note_id="@N999@")
+        self.assertTrue(result.startswith("Error"))
+        self.assertEqual(len(person.get_child_elements()), child_count)
+
     def test_remove_person_attribute_internal(self):
         # First add an attribute to remove
         _update_person_attribute_internal(self.gedcom_ctx, "@I1@", "OCCU", "Engineer")
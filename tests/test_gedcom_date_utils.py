@@ -5,7 +5,7 @@ import unittest
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.gedcom_mcp.parser.gedcom_date_utils import parse_genealogy_date, validate_date_consistency, get_date_certainty_level, _month_to_number, GenealogyDate
+from src.gedcom_mcp.parser.gedcom_date_utils import parse_genealogy_date, parse_genealogy_dates_bulk, validate_date_consistency, validate_date_consistency_parsed, get_date_certainty_level, _month_to_number, GenealogyDate, DateCertainty
 
 
 class TestGedcomDateUtils(unittest.TestCase):
@@ -16,6 +16,47 @@ class TestGedcomDateUtils(unittest.TestCase):
         self.assertEqual(date.month, 1)
         self.assertEqual(date.day, 1)
 
+    def test_parse_genealogy_date_qualifiers(self):
+        date = parse_genealogy_date("BEF 1850")
+        self.assertEqual(date.certainty, DateCertainty.BEFORE)
+        self.assertEqual(date.year, 1850)
+        self.assertEqual(date.qualifier, "BEF")
+
+        date = parse_genealogy_date("estimated 1850")
+        self.assertEqual(date.certainty, DateCertainty.ESTIMATED)
+        self.assertEqual(date.qualifier, "ESTIMATED")
+
+        date = parse_genealogy_date("BET 1860 AND 1850")
+        self.assertEqual(date.certainty, DateCertainty.BETWEEN)
+        self.assertEqual((date.year, date.year_end), (1850, 1860))
+
+    def test_parse_genealogy_date_dual(self):
+        date = parse_genealogy_date("1880 (1881)")
+        self.assertEqual(date.certainty, DateCertainty.EXACT)
+        self.assertEqual(date.year, 1880)
+        self.assertEqual(date.qualifier, "dual")
+
+    def test_parse_genealogy_date_cached_copies(self):
+        first = parse_genealogy_date("ABT 1850")
+        first.year = 1900
+        second = parse_genealogy_date("ABT 1850")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.year, 1850)
+
+    def test_parse_genealogy_dates_bulk(self):
+        dates = parse_genealogy_dates_bulk(["1850", "ABT 1860", "1850", ""])
+        self.assertEqual([d.year for d in dates], [1850, 1860, 1850, None])
+        self.assertIs(dates[0], dates[2])
+        # The results are copies, so the parse cache is unaffected by callers
+        self.assertIsNot(dates[0], parse_genealogy_dates_bulk(["1850"])[0])
+
+    def test_genealogy_date_to_dict(self):
+        data = parse_genealogy_date("BET 1850 AND 1860").to_dict()
+        self.assertEqual(list(data), ["original_text", "certainty", "year", "month", "day",
+                                      "year_end", "month_end", "day_end", "qualifier"])
+        self.assertEqual(data["certainty"], "between")
+        self.assertEqual((data["year"], data["year_end"]), (1850, 1860))
+
     def test_validate_date_consistency(self):
         is_valid, error_msg = validate_date_consistency("1 JAN 1970", "1 JAN 2020")
         self.assertTrue(is_valid)
@@ -23,6 +64,12 @@ class TestGedcomDateUtils(unittest.TestCase):
         is_valid, error_msg = validate_date_consistency("1 JAN 2020", "1 JAN 1970")
         self.assertFalse(is_valid)
 
+    def test_validate_date_consistency_parsed(self):
+        birth = parse_genealogy_date("5 MAR 1900")
+        self.assertFalse(validate_date_consistency_parsed(birth, parse_genealogy_date("1 MAR 1900"))[0])
+        self.assertTrue(validate_date_consistency_parsed(birth, parse_genealogy_date("1950"))[0])
+        self.assertTrue(validate_date_consistency_parsed(birth, None)[0])
+
     def test_get_date_certainty_level(self):
         certainty = get_date_certainty_level("ABT 1970")
         self.assertEqual(certainty, "About 1970 (approximate)")
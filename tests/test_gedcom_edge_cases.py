@@ -126,7 +126,7 @@ class TestGedcomEdgeCases(unittest.TestCase):
         neighbors = _get_person_neighbors_lazy("@I1@", {"parent", "spouse", "child"}, self.gedcom_ctx)
         
         # Should return a list
-        self.assertIsInstance(neighbors, list)
+        self.assertIsInstance(neighbors, tuple)
         
         # Each neighbor should be a tuple of (person_id, weight, relationship_type)
         if neighbors:
@@ -147,14 +147,14 @@ class TestGedcomEdgeCases(unittest.TestCase):
         """Test _get_person_neighbors_lazy with empty relationship types"""
         # Test with no allowed relationship types
         neighbors = _get_person_neighbors_lazy("@I1@", set(), self.gedcom_ctx)
-        self.assertIsInstance(neighbors, list)
+        self.assertIsInstance(neighbors, tuple)
         self.assertEqual(len(neighbors), 0)
 
     def test_get_person_neighbors_lazy_single_relationship_type(self):
         """Test _get_person_neighbors_lazy with single relationship type"""
         # Test with only spouse relationships
         neighbors = _get_person_neighbors_lazy("@I1@", {"spouse"}, self.gedcom_ctx)
-        self.assertIsInstance(neighbors, list)
+        self.assertIsInstance(neighbors, tuple)
         
         # Should only include spouse relationships
         for neighbor in neighbors:
@@ -1,10 +1,13 @@
 import os
 import sys
 import unittest
+from pathlib import Path
 
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from src.gedcom_mcp.parser.gedcom_context import GedcomContext
+from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file
 from src.gedcom_mcp.parser.gedcom_models import PersonDetails, PersonRelationships, NodePriority
 
 
@@ -59,16 +62,16 @@ class TestGedcomModels(unittest.TestCase):
         relationships = PersonRelationships(
             id="@I1@",
             gender="M",
-            parents=["@I3@", "@I4@"],
-            spouses=["@I2@"],
-            children=["@I5@"]
+            parents=("@I3@", "@I4@"),
+            spouses=("@I2@",),
+            children=("@I5@",)
         )
         
         self.assertEqual(relationships.id, "@I1@")
         self.assertEqual(relationships.gender, "M")
-        self.assertEqual(relationships.parents, ["@I3@", "@I4@"])
-        self.assertEqual(relationships.spouses, ["@I2@"])
-        self.assertEqual(relationships.children, ["@I5@"])
+        self.assertEqual(relationships.parents, ("@I3@", "@I4@"))
+        self.assertEqual(relationships.spouses, ("@I2@",))
+        self.assertEqual(relationships.children, ("@I5@",))
 
     def test_person_relationships_model_defaults(self):
         """Test PersonRelationships model with default values"""
@@ -76,22 +79,20 @@ class TestGedcomModels(unittest.TestCase):
         
         self.assertEqual(relationships.id, "@I1@")
         self.assertIsNone(relationships.gender)
-        self.assertEqual(relationships.parents, [])
-        self.assertEqual(relationships.spouses, [])
-        self.assertEqual(relationships.children, [])
+        self.assertEqual(relationships.parents, ())
+        self.assertEqual(relationships.spouses, ())
+        self.assertEqual(relationships.children, ())
 
     def test_node_priority_creation(self):
         """Test NodePriority creation and initialization"""
         node = NodePriority(
             distance=5,
-            person_id="@I1@",
-            path=["@I1@", "@I2@", "@I3@"],
+            person_id="@I3@",
             target_birth_year=1970
         )
         
         self.assertEqual(node.distance, 5)
-        self.assertEqual(node.person_id, "@I1@")
-        self.assertEqual(node.path, ["@I1@", "@I2@", "@I3@"])
+        self.assertEqual(node.person_id, "@I3@")
         self.assertEqual(node.target_birth_year, 1970)
         
         # Check that computed fields are initialized
@@ -100,20 +101,34 @@ class TestGedcomModels(unittest.TestCase):
 
     def test_node_priority_comparison(self):
         """Test NodePriority comparison methods"""
-        node1 = NodePriority(1, "@I1@", ["@I1@"], 1970)
-        node2 = NodePriority(2, "@I2@", ["@I2@"], 1970)
+        node1 = NodePriority(1, "@I1@", 1970)
+        node2 = NodePriority(2, "@I2@", 1970)
         
         # Test __lt__ method
         self.assertTrue(node1 < node2)
         self.assertFalse(node2 < node1)
         
         # Test __eq__ method
-        node3 = NodePriority(1, "@I1@", ["@I1@"], 1970)
+        node3 = NodePriority(1, "@I1@", 1970)
         self.assertEqual(node1, node3)
+        self.assertTrue(node1 <= node3)
+
+        # Other types are not comparable, but must not blow up on attribute access
+        self.assertNotEqual(node1, "@I1@")
+        self.assertFalse(node1 == None)
+        with self.assertRaises(TypeError):
+            node1 < 1
+
+    def test_node_priority_without_target_birth_year(self):
+        """Test that NodePriority orders by distance when no birth-year target is given"""
+        node = NodePriority(2, "@I2@")
+        self.assertIsNone(node.target_birth_year)
+        self.assertTrue(NodePriority(1, "@I9@") < node)
+        self.assertTrue(NodePriority(2, "@I1@") < node)
 
     def test_node_priority_heuristics(self):
         """Test NodePriority heuristic initialization"""
-        node = NodePriority(5, "@I1@", ["@I1@"], 1970)
+        node = NodePriority(5, "@I1@", 1970)
         
         # Test that init_heuristics can be called (doesn't crash)
         # We can't easily test the actual heuristic values without a full context
@@ -133,6 +148,22 @@ class TestGedcomModels(unittest.TestCase):
         # The method should handle None context gracefully
         self.assertTrue(success)
 
+    def test_node_priority_heuristics_memoizes_birth_year(self):
+        """Test that init_heuristics caches birth years on the context"""
+        gedcom_ctx = GedcomContext()
+        load_gedcom_file(str(Path(__file__).parent / "sample.ged"), gedcom_ctx)
+
+        node = NodePriority(1, "@I1@", 1970)
+        node.init_heuristics(gedcom_ctx)
+        self.assertEqual(gedcom_ctx.birth_year_cache["@I1@"], 1970)
+        self.assertEqual(node._birth_year_distance, 0)
+
+        # People without a birth year are cached too
+        gedcom_ctx.birth_year_cache.clear()
+        NodePriority(1, "@I999@", 1970).init_heuristics(gedcom_ctx)
+        self.assertIn("@I999@", gedcom_ctx.birth_year_cache)
+        self.assertIsNone(gedcom_ctx.birth_year_cache["@I999@"])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,7 @@ import unittest
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.gedcom_mcp.parser.gedcom_name_utils import parse_genealogy_name, normalize_name, find_name_variants, GenealogyName, format_gedcom_name, format_gedcom_name_from_string
+from src.gedcom_mcp.parser.gedcom_name_utils import parse_genealogy_name, parse_genealogy_names, normalize_name, find_name_variants, GenealogyName, format_gedcom_name, format_gedcom_name_from_string
 
 
 class TestGedcomNameUtils(unittest.TestCase):
@@ -31,6 +31,13 @@ class TestGedcomNameUtils(unittest.TestCase):
         self.assertEqual(name.suffix, "Jr.")
         self.assertEqual(str(name), "Dr. Robert James Williams Jr.")
 
+    def test_parse_genealogy_name_undotted_title_and_roman_suffix(self):
+        # Titles and suffixes without periods must still reach nameparser
+        name = parse_genealogy_name("Sir Edward /Spencer/ VIII")
+        self.assertEqual(name.title, "Sir")
+        self.assertEqual(name.suffix, "VIII")
+        self.assertEqual(name.given_names, ["Edward"])
+
     def test_parse_genealogy_name_complex_surname(self):
         # Test complex multi-word surnames
         name = parse_genealogy_name("Maria /de la Cruz/")
@@ -41,6 +48,37 @@ class TestGedcomNameUtils(unittest.TestCase):
         self.assertEqual(name.given_names, ["James"])
         self.assertEqual(name.surname, "Van Buren")
 
+    def test_parse_genealogy_name_without_slashes(self):
+        name = parse_genealogy_name("John Jacob Smith")
+        self.assertEqual(name.given_names, ["John", "Jacob"])
+        self.assertEqual(name.surname, "Smith")
+
+        # Surname prefixes and titles still go through nameparser
+        name = parse_genealogy_name("Ludwig van Beethoven")
+        self.assertEqual(name.given_names, ["Ludwig"])
+        self.assertEqual(name.surname, "van Beethoven")
+        name = parse_genealogy_name("Dr John Smith")
+        self.assertEqual((name.title, name.given_names, name.surname), ("Dr", ["John"], "Smith"))
+
+    def test_parse_genealogy_name_cached_copies(self):
+        first = parse_genealogy_name("John /Smith/")
+        first.given_names.append("Extra")
+        second = parse_genealogy_name("  John /Smith/ ")
+        self.assertEqual(second.given_names, ["John"])
+        self.assertEqual(second.original_text, "John /Smith/")
+
+        empty = parse_genealogy_name("")
+        self.assertEqual(empty.given_names, [])
+        empty.given_names.append("Extra")
+        self.assertEqual(parse_genealogy_name(None).given_names, [])
+
+    def test_parse_genealogy_names(self):
+        columns = parse_genealogy_names(["John /Smith/", "", 'Dr. Mary "May" /Jones/'])
+        self.assertEqual(columns["surname"], ["Smith", "", "Jones"])
+        self.assertEqual(columns["given_first"], ["John", None, "Mary"])
+        self.assertEqual(columns["prefix"], [None, None, "Dr."])
+        self.assertEqual(columns["nickname"], [None, None, "May"])
+
     def test_normalize_name(self):
         normalized_name = normalize_name("  John  /Smith/  ")
         self.assertEqual(normalized_name, "john smith")
@@ -5,7 +5,7 @@ import unittest
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.gedcom_mcp.parser.gedcom_place_utils import normalize_place_name, extract_geographic_hierarchy, NormalizedPlace
+from src.gedcom_mcp.parser.gedcom_place_utils import normalize_place_name, normalize_place_names, extract_geographic_hierarchy, NormalizedPlace
 
 class TestGedcomPlaceUtils(unittest.TestCase):
 
@@ -13,11 +13,51 @@ class TestGedcomPlaceUtils(unittest.TestCase):
         normalized_place = normalize_place_name("  London,  England  ")
         self.assertEqual(normalized_place.normalized_name, "London,  England")
 
+    def test_normalize_place_name_cached_copies(self):
+        first = normalize_place_name("Paris, France")
+        first.city = "Lyon"
+        second = normalize_place_name("Paris, France")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.city, "Paris")
+
+    def test_normalize_place_name_empty(self):
+        # Each empty result is the caller's own object
+        place = normalize_place_name("")
+        place.country = "X"
+        self.assertIsNone(normalize_place_name(None).country)
+
+    def test_normalize_place_names(self):
+        places = normalize_place_names(["Paris, France", "", "Paris, France"])
+        self.assertEqual([p.city for p in places], ["Paris", None, "Paris"])
+        self.assertIs(places[0], places[2])
+
     def test_extract_geographic_hierarchy(self):
         hierarchy = extract_geographic_hierarchy("London, Middlesex, England")
         self.assertEqual(hierarchy['city'], "London")
         self.assertEqual(hierarchy['state_province'], "Middlesex")
         self.assertEqual(hierarchy['country'], "England")
 
+    def test_extract_geographic_hierarchy_layouts(self):
+        hierarchy = extract_geographic_hierarchy("Nancy, 54000, Meurthe-et-Moselle, Grand-Est, France")
+        self.assertEqual(hierarchy['postal_code'], "54000")
+        self.assertEqual(hierarchy['department'], "Meurthe-et-Moselle")
+        self.assertEqual(hierarchy['country'], "France")
+
+        # Empty jurisdictions are positional placeholders
+        hierarchy = extract_geographic_hierarchy("Windsor,,,England")
+        self.assertEqual(hierarchy['city'], "Windsor")
+        self.assertIsNone(hierarchy['department'])
+        self.assertIsNone(hierarchy['region'])
+        self.assertEqual(hierarchy['country'], "England")
+
+    def test_extract_geographic_hierarchy_late_postal_code(self):
+        # A street address before the postal code stays with the city
+        hierarchy = extract_geographic_hierarchy("1 Main St, Springfield, 62701, Sangamon, Illinois, USA")
+        self.assertEqual(hierarchy['city'], "1 Main St, Springfield")
+        self.assertEqual(hierarchy['postal_code'], "62701")
+        self.assertEqual(hierarchy['department'], "Sangamon")
+        self.assertEqual(hierarchy['region'], "Illinois")
+        self.assertEqual(hierarchy['country'], "USA")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -9,8 +9,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.gedcom_mcp.parser.gedcom_context import GedcomContext
-from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file
-from src.gedcom_mcp.parser.gedcom_search import _dijkstra_bidirectional_search, _get_person_neighbors_lazy, _get_person_neighbors_lazy_reverse, _generate_relationship_chain_lazy, _correct_relationship_direction, _generate_relationship_description, _format_relationship_with_gender, _format_relationship_description, find_shortest_relationship_path, _find_all_relationship_paths_internal, _find_all_paths_to_ancestor_internal, check_component_connectivity
+from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file, get_person_record
+from src.gedcom_mcp.parser.gedcom_search import _dijkstra_bidirectional_search, _get_person_neighbors_lazy, _get_adjacency, _get_components, _relationship_mask, REL_PARENT, REL_CHILD, _generate_relationship_chain_lazy, _correct_relationship_direction, _generate_relationship_description, _format_relationship_with_gender, _format_relationship_description, find_shortest_relationship_path, _find_all_relationship_paths_internal, _find_all_paths_to_ancestor_internal, check_component_connectivity, _filter_redundant_paths, _parse_allowed, _is_symmetric_mask, _find_shortest_core
 
 
 class TestGedcomSearch(unittest.TestCase):
@@ -26,6 +26,29 @@ class TestGedcomSearch(unittest.TestCase):
         self.assertIn("path", result)
         self.assertEqual(len(result['path']), 2)  # John Smith -> Junior Smith
 
+    def test_find_shortest_relationship_path_cached(self):
+        result = find_shortest_relationship_path("@I1@", "@I3@", "all", self.gedcom_ctx)
+        self.assertFalse(result["performance"]["cache_hit"])
+        hit = find_shortest_relationship_path("@I1@", "@I3@", "all", self.gedcom_ctx)
+        self.assertIsNot(hit, result)
+        self.assertIs(hit["path"], result["path"])
+        # A hit reports its own timing rather than the cold search's
+        self.assertTrue(hit["performance"]["cache_hit"])
+        self.assertNotIn("search_time", hit["performance"])
+        # A different argument is a different query
+        self.assertIsNot(find_shortest_relationship_path("@I1@", "@I3@", "blood", self.gedcom_ctx)["path"], result["path"])
+        self.gedcom_ctx.clear_caches()
+        self.assertIsNot(find_shortest_relationship_path("@I1@", "@I3@", "all", self.gedcom_ctx)["path"], result["path"])
+
+    def test_find_shortest_core(self):
+        allowed = _parse_allowed("all")
+        self.assertEqual(_find_shortest_core("@I1@", "@I3@", allowed, self.gedcom_ctx), (("@I1@", "@I3@"), 1))
+        self.assertEqual(_find_shortest_core("@I1@", "@I3@", _parse_allowed("spouse"), self.gedcom_ctx), (None, -1))
+        # The formatted result is built on top of the cached core result
+        self.assertEqual(len(self.gedcom_ctx.shortest_cache), 2)
+        find_shortest_relationship_path("@I1@", "@I3@", "all", self.gedcom_ctx)
+        self.assertEqual(len(self.gedcom_ctx.shortest_cache), 2)
+
     def test_find_all_relationship_paths_internal(self):
         result = _find_all_relationship_paths_internal("@I1@", "@I3@", "all", self.gedcom_ctx)
         self.assertIsInstance(result, dict)
@@ -39,16 +62,38 @@ class TestGedcomSearch(unittest.TestCase):
     def test_get_person_neighbors_lazy(self):
         # Test getting neighbors for a person
         neighbors = _get_person_neighbors_lazy("@I1@", {"parent", "spouse", "child"}, self.gedcom_ctx)
-        self.assertIsInstance(neighbors, list)
+        self.assertIsInstance(neighbors, tuple)
         # John Smith should have a spouse (Jane Doe) and a child (Junior Smith)
         self.assertGreater(len(neighbors), 0)
 
-    def test_get_person_neighbors_lazy_reverse(self):
-        # Test getting reverse neighbors for a person
-        neighbors = _get_person_neighbors_lazy_reverse("@I3@", {"parent", "spouse", "child"}, self.gedcom_ctx)
-        self.assertIsInstance(neighbors, list)
-        # Junior Smith should have parents (John Smith and Jane Doe)
-        self.assertGreater(len(neighbors), 0)
+    def test_relationship_mask(self):
+        self.assertEqual(_relationship_mask({"parent", "child"}), REL_PARENT | REL_CHILD)
+        self.assertEqual(_relationship_mask({"parent", "cousin"}), REL_PARENT)
+        _get_person_neighbors_lazy("@I1@", {"child", "parent"}, self.gedcom_ctx)
+        self.assertIn(("@I1@", REL_PARENT | REL_CHILD, False), self.gedcom_ctx.neighbor_cache)
+
+    def test_get_adjacency(self):
+        allowed = {"parent", "spouse", "child"}
+        adjacency = _get_adjacency(allowed, self.gedcom_ctx)
+        self.assertEqual(set(adjacency), set(self.gedcom_ctx.individual_lookup))
+        self.assertEqual(adjacency["@I1@"], _get_person_neighbors_lazy("@I1@", allowed, self.gedcom_ctx))
+        # Built once per set of allowed relationships, dropped with the other caches
+        self.assertIs(_get_adjacency(allowed, self.gedcom_ctx), adjacency)
+        self.gedcom_ctx.clear_caches()
+        self.assertIsNot(_get_adjacency(allowed, self.gedcom_ctx), adjacency)
+
+    def test_get_components(self):
+        allowed = {"parent", "spouse", "child"}
+        component_of = _get_components(allowed, self.gedcom_ctx)
+        self.assertEqual(component_of["@I1@"], component_of["@I3@"])
+        self.assertIs(_get_components(allowed, self.gedcom_ctx), component_of)
+
+        # Nobody is reachable through siblings alone in the sample tree
+        component_of = _get_components({"sibling"}, self.gedcom_ctx)
+        self.assertNotEqual(component_of["@I1@"], component_of["@I3@"])
+        path, distance = _dijkstra_bidirectional_search("@I1@", "@I3@", {"sibling"}, self.gedcom_ctx)
+        self.assertIsNone(path)
+        self.assertEqual(distance, -1)
 
     def test_generate_relationship_chain_lazy(self):
         # Test generating relationship chain
@@ -77,6 +122,13 @@ class TestGedcomSearch(unittest.TestCase):
         self.assertIn("John Smith", description)
         self.assertIn("Junior Smith", description)
 
+    def test_generate_relationship_description_record_cache(self):
+        # Records passed in are used instead of being looked up again
+        path = ["@I1@", "@I3@"]
+        records = {"@I1@": get_person_record("@I1@", self.gedcom_ctx).model_copy(update={"name": "Cached Name"})}
+        description = _generate_relationship_description(path, ["father_of"], self.gedcom_ctx, records)
+        self.assertEqual(description, "Cached Name is the father of Junior Smith")
+
     def test_format_relationship_with_gender(self):
         # Test formatting relationship with gender
         formatted = _format_relationship_with_gender("father_of", "@I1@", "@I3@", self.gedcom_ctx)
@@ -97,5 +149,25 @@ class TestGedcomSearch(unittest.TestCase):
         self.assertTrue(result is True or result is None)  # True if connected, None if inconclusive
 
 
+    def test_is_symmetric_mask(self):
+        self.assertTrue(_is_symmetric_mask(_relationship_mask({"parent", "child", "spouse"})))
+        self.assertFalse(_is_symmetric_mask(_relationship_mask({"parent"})))
+        self.assertFalse(_is_symmetric_mask(_relationship_mask({"mother", "child"})))
+
+    def test_parse_allowed(self):
+        self.assertEqual(_parse_allowed("Blood"), frozenset({"parent", "child"}))
+        self.assertEqual(_parse_allowed("parents, sibling"), frozenset({"parent", "sibling"}))
+        self.assertEqual(_parse_allowed("spouse,unknown"), frozenset({"spouse"}))
+
+    def test_filter_redundant_paths(self):
+        # Longer paths through every person of a shorter path are dropped
+        paths = [
+            {"path": ["@I1@", "@I4@", "@I2@", "@I3@"]},
+            {"path": ["@I1@", "@I3@"]},
+            {"path": ["@I1@", "@I2@", "@I3@"]},
+        ]
+        self.assertEqual(_filter_redundant_paths(paths, self.gedcom_ctx), [{"path": ["@I1@", "@I3@"]}])
+
+
 if __name__ == '__main__':
     unittest.main()
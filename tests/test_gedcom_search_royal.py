@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from src.gedcom_mcp.parser.gedcom_context import GedcomContext
 from src.gedcom_mcp.parser.gedcom_data_access import load_gedcom_file
-from src.gedcom_mcp.parser.gedcom_search import find_shortest_relationship_path, _find_all_relationship_paths_internal
+from src.gedcom_mcp.parser.gedcom_search import find_shortest_relationship_path, _find_all_relationship_paths_internal, _get_person_neighbors_lazy
 
 
 class TestGedcomSearchComplex(unittest.TestCase):
@@ -186,6 +186,19 @@ class TestGedcomSearchComplex(unittest.TestCase):
             self.assertIsNotNone(result2["path"])
             self.assertNotEqual(result2["distance"], -1)
 
+    def test_royal_family_siblings_memoized(self):
+        """Test that sibling lookups are memoized as sorted tuples"""
+        neighbors = _get_person_neighbors_lazy("@I58@", {"sibling"}, self.gedcom_ctx)
+        self.assertEqual([n[0] for n in neighbors], ["@I59@", "@I60@", "@I61@"])
+        self.assertEqual(self.gedcom_ctx.sibling_cache["@I58@"], ("@I59@", "@I60@", "@I61@"))
+
+    def test_royal_family_path_is_shortest(self):
+        """Test that the search keeps going past the first meeting point until the path is shortest"""
+        # The first node settled by both sides lies on a path of length 5; the shortest is 4
+        result = find_shortest_relationship_path("@I2993@", "@I58@", "all", self.gedcom_ctx)
+        self.assertEqual(result["distance"], 4)
+        self.assertEqual(len(result["path"]), 5)
+
 
 if __name__ == '__main__':
     # Check if royal92.ged exists before running tests
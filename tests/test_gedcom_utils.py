@@ -5,15 +5,29 @@ import unittest
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.gedcom_mcp.parser.gedcom_utils import normalize_string, _get_gedcom_tag_from_event_type, _get_gedcom_tag_from_attribute_type, extract_birth_year, _extract_year_from_genealogy_date, _normalize_genealogy_name, _normalize_genealogy_date, _normalize_genealogy_place, _extract_year_from_date, _matches_criteria
+from src.gedcom_mcp.parser.gedcom_utils import normalize_string, _get_gedcom_tag_from_event_type, _get_gedcom_tag_from_attribute_type, extract_birth_year, _extract_year_from_genealogy_date, _normalize_genealogy_name, _normalize_genealogy_date, _normalize_genealogy_place, _extract_year_from_date, _matches_criteria, _compile_criteria, _matches_compiled
+from src.gedcom_mcp.parser.gedcom_models import PersonDetails
 
 class TestGedcomUtils(unittest.TestCase):
 
     def test_normalize_string(self):
         self.assertEqual(normalize_string("  Test  String  "), "test string")
 
+    def test_normalize_string_accents(self):
+        self.assertEqual(normalize_string("Joséphine  Muñoz"), "josephine munoz")
+        # Letters without a decomposition still reach plain ASCII
+        self.assertEqual(normalize_string("Søren Straße"), "soren strasse")
+
+    def test_normalize_string_non_str(self):
+        # Non-strings are returned unchanged rather than going through the cache
+        self.assertIsNone(normalize_string(None))
+        self.assertEqual(normalize_string(42), 42)
+        self.assertEqual(normalize_string(["Émile"]), ["Émile"])
+
     def test_get_gedcom_tag_from_event_type(self):
         self.assertEqual(_get_gedcom_tag_from_event_type("Marriage"), "MARR")
+        self.assertEqual(_get_gedcom_tag_from_event_type("marr"), "MARR")
+        self.assertIsNone(_get_gedcom_tag_from_event_type("Coronation"))
 
     def test_get_gedcom_tag_from_attribute_type(self):
         self.assertEqual(_get_gedcom_tag_from_attribute_type("Occupation"), "OCCU")
@@ -42,5 +56,13 @@ class TestGedcomUtils(unittest.TestCase):
         # We will skip this test for now.
         pass
 
+    def test_matches_compiled(self):
+        person = PersonDetails(id="@I1@", name="Émile Durand", birth_date="ABT 1850", birth_place="Paris, France", occupation="Farmer")
+        compiled = _compile_criteria({"name_contains": "  EMILE ", "birth_place_contains": "paris", "birth_year_range": [1840, 1860]})
+        self.assertEqual(compiled[0], ("name_contains", "emile"))
+        self.assertTrue(_matches_compiled(person, compiled))
+        self.assertFalse(_matches_compiled(person, _compile_criteria({"occupation": "Smith"})))
+        self.assertTrue(_matches_criteria(person, {"occupation": "farm", "is_living": True}))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file